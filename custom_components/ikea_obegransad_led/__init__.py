@@ -13,56 +13,84 @@ The integration uses a data coordinator to manage state updates and communicatio
 with the device through its API client.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import Any
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
-from .api import IkeaObegransadLedApiClient
+from .api import (
+    BREAKER_CLOSED,
+    BREAKER_OPEN,
+    IkeaObegransadLedApiClient,
+    create_device_session,
+)
+from .cache import IkeaObegransadStateCache
+from .coalescer import IkeaObegransadCommandCoalescer
 from .const import (
-    ATTR_DELAY,
-    ATTR_DIRECTION,
-    ATTR_GRAPH,
-    ATTR_MAXY,
-    ATTR_MESSAGE,
-    ATTR_MESSAGE_ID,
-    ATTR_MINY,
-    ATTR_REPEAT,
-    ATTR_SCHEDULE,
     CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT,
     CONF_HOST,
     CONF_SCAN_INTERVAL,
     CONF_WEATHER_LOCATION,
     DOMAIN,
+    DOMAIN_DATA,
     PLATFORMS,
-    SERVICE_CLEAR_SCHEDULE,
-    SERVICE_CLEAR_STORAGE,
-    SERVICE_GET_DISPLAY_DATA,
-    SERVICE_PERSIST_PLUGIN,
-    SERVICE_REMOVE_MESSAGE,
-    SERVICE_ROTATE_DISPLAY,
-    SERVICE_SEND_MESSAGE,
-    SERVICE_SET_SCHEDULE,
-    SERVICE_START_SCHEDULE,
-    SERVICE_STOP_SCHEDULE,
 )
+from .fleet import IkeaObegransadFleet
+from .models import EMPTY_CATALOG, DeviceState, PluginCatalog
+from .services import async_setup_services
 from .websocket import IkeaObegransadWebSocket
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+WS_COMMAND_TIMEOUT = 2.0
+WS_INFO_TIMEOUT = 3.0
+# Window in which bursts of WebSocket info events are merged into one update
+PUSH_DEBOUNCE_COOLDOWN = 0.25
+# How long optimistic state waits for confirmation before a refresh is forced
+OPTIMISTIC_CONFIRM_TIMEOUT = 5.0
+
+# Push-first polling: while the WebSocket is healthy only a slow safety poll
+# runs; when it drops, polling restarts fast and backs off to the scan interval
+PUSH_HEALTHY_WINDOW = 300
+SAFETY_POLL_INTERVAL = 300
+FALLBACK_MIN_INTERVAL = 5
+
+# Change markers entities can subscribe to through fields_changed, next to
+# the DeviceState field names
+FIELD_AVAILABLE = "available"
+FIELD_PLUGIN_CATALOG = "plugin_catalog"
+FIELD_ACTIVE_EFFECT = "active_effect_name"
+FIELD_WEATHER_LOCATION = "weather_location"
+TRANSPORT_WEBSOCKET = "websocket"
+TRANSPORT_REST = "rest"
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:  # noqa: ARG001
     """Set up the integration."""
     _LOGGER.debug("Setting up IKEA OBEGRÄNSAD Led integration.")
-    hass.data.setdefault(DOMAIN, {})
+    fleet = IkeaObegransadFleet(hass)
+    hass.data[DOMAIN_DATA] = fleet
+    # Platforms look their coordinator up here; the fleet owns the mapping
+    hass.data[DOMAIN] = fleet.coordinators
+    await fleet.video_wall.async_load()
+    async_setup_services(hass)
     return True
 
 
@@ -86,236 +114,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "Setting up config entry for IKEA OBEGRÄNSAD Led with host: %s",
         entry.data[CONF_HOST],
     )
+    setup_started = time.monotonic()
+
+    # Dedicated keep-alive pool for this lamp, closed in async_unload_entry or
+    # when Home Assistant stops
+    session = create_device_session()
+
+    async def async_close_session(_event: Event) -> None:
+        """Close the lamp's session on Home Assistant shutdown."""
+        await session.close()
 
-    session = async_get_clientsession(hass)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+    )
     client = IkeaObegransadLedApiClient(session, entry.data[CONF_HOST])
+    cache = IkeaObegransadStateCache(hass, entry.entry_id)
 
     coordinator = IkeaObegransadLedDataUpdateCoordinator(
-        hass, client, update_method=client.get_info
+        hass, client, update_method=client.get_info, cache=cache
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
-    if coordinator.last_update_success:
-        _LOGGER.info("Successfully set up config entry for IKEA OBEGRÄNSAD Led.")
-        hass.data[DOMAIN][entry.entry_id] = coordinator
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-        weather_location = entry.data.get(CONF_WEATHER_LOCATION, "").strip()
-        if weather_location:
-            if await client.set_weather_location(weather_location):
-                coordinator.weather_location = weather_location
-        else:
-            config = await client.get_config()
-            if config:
-                coordinator.weather_location = config.get("weatherLocation")
-
-        # Creazione automatica di input_text.ikea_message se non esiste
-        entity_id = "input_text.ikea_message"
-        name = "IKEA OBEGRÄNSAD Message"
-        if entity_id not in hass.states.async_all():
-            _LOGGER.info("Creating input_text.ikea_message entity.")
-            hass.states.async_set(entity_id, "", {"friendly_name": name})
-
-        websocket = IkeaObegransadWebSocket(entry.data[CONF_HOST], session)
-        coordinator.websocket = websocket
-
-        async def handle_ws_message(data: dict[str, Any]) -> None:
-            """Handle WebSocket info messages from the device."""
-            if data.get("event") != "info":
-                return
-            coordinator.update_from_info(data)
-            coordinator.async_set_updated_data(data)
-
-        websocket.add_callback(handle_ws_message)
-        coordinator.websocket_task = hass.async_create_task(
-            websocket.listen_forever()
-        )
-
-
-        async def handle_send_message(call: ServiceCall) -> None:
-            """
-            Handle sending a message to the lamp.
-
-            Asynchronously sends a text message to be displayed on the lamp.
-
-            Args:
-                call (ServiceCall): The service call containing message parameters.
-                    Required parameters:
-                        message (str): The text message to display
-                    Optional parameters:
-                        repeat (int, optional): Number of times to repeat the message.
-                        Defaults to 1.
-                        delay (int, optional): Delay between message repetitions
-                        in milliseconds. Defaults to 70.
-
-            Raises:
-                aiohttp.ClientError: If there is a connection error when
-                changing the animation.
-
-            Returns:
-                None: This function doesn't return anything.
-
-            """
-            """Handle sending a message to the lamp."""
-            message = call.data.get(ATTR_MESSAGE, "")
-            repeat = call.data.get(ATTR_REPEAT, 1)
-            delay = call.data.get(ATTR_DELAY, 70)
-            graph_str = call.data.get(ATTR_GRAPH)
-            miny = call.data.get(ATTR_MINY)
-            maxy = call.data.get(ATTR_MAXY)
-            message_id = call.data.get(ATTR_MESSAGE_ID)
-
-            # Parse graph string to list of integers
-            graph = None
-            if graph_str:
-                try:
-                    graph = [int(x.strip()) for x in graph_str.split(",")]
-                except ValueError:
-                    _LOGGER.error("Invalid graph format: %s", graph_str)
-
-            if not message and not graph:
-                _LOGGER.error("No message or graph provided")
-                return
-            try:
-                await client.set_plugin_by_name(CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT)
-                _LOGGER.info("Animation changed to DDP.")
-
-            except aiohttp.ClientError:
-                _LOGGER.exception("Failed to change animation due to connection error")
-
-            await client.send_message(
-                text=message,
-                repeat=repeat,
-                delay=delay,
-                graph=graph,
-                miny=miny,
-                maxy=maxy,
-                message_id=message_id,
-            )
-            _LOGGER.info("Message sent to IKEA OBEGRÄNSAD LED: %s", message)
-
-        async def handle_remove_message(call: ServiceCall) -> None:
-            """Handle removing a message from the lamp."""
-            message_id = call.data.get(ATTR_MESSAGE_ID)
-            if not message_id:
-                _LOGGER.error("No message_id provided")
-                return
-            await client.remove_message(message_id)
-            _LOGGER.info("Message removed: %s", message_id)
-
-        async def handle_set_schedule(call: ServiceCall) -> None:
-            """Handle setting plugin schedule."""
-            schedule = call.data.get(ATTR_SCHEDULE)
-            if not schedule:
-                _LOGGER.error("No schedule provided")
-                return
-            result = await client.set_schedule(schedule)
-            if result:
-                await coordinator.async_request_refresh()
-                _LOGGER.info("Schedule set successfully")
-            else:
-                _LOGGER.error("Failed to set schedule")
-
-        async def handle_start_schedule(call: ServiceCall) -> None:
-            """Handle starting the schedule."""
-            result = await client.start_schedule()
-            if result:
-                await coordinator.async_request_refresh()
-                _LOGGER.info("Schedule started")
-            else:
-                _LOGGER.error("Failed to start schedule")
-
-        async def handle_stop_schedule(call: ServiceCall) -> None:
-            """Handle stopping the schedule."""
-            result = await client.stop_schedule()
-            if result:
-                await coordinator.async_request_refresh()
-                _LOGGER.info("Schedule stopped")
-            else:
-                _LOGGER.error("Failed to stop schedule")
-
-        async def handle_clear_schedule(call: ServiceCall) -> None:
-            """Handle clearing the schedule."""
-            result = await client.clear_schedule()
-            if result:
-                await coordinator.async_request_refresh()
-                _LOGGER.info("Schedule cleared")
-            else:
-                _LOGGER.error("Failed to clear schedule")
-
-        async def handle_rotate_display(call: ServiceCall) -> None:
-            """Handle rotating the display."""
-            direction = call.data.get(ATTR_DIRECTION, "right")
-            if coordinator.websocket:
-                result = await coordinator.websocket.rotate_display(direction)
-                if result:
-                    await coordinator.websocket.request_info()
-                    _LOGGER.info("Display rotated %s", direction)
-                else:
-                    _LOGGER.error("Failed to rotate display via WebSocket")
-            else:
-                _LOGGER.warning("WebSocket not initialized for rotate_display")
-
-        async def handle_persist_plugin(call: ServiceCall) -> None:
-            """Handle persisting current plugin."""
-            if coordinator.websocket:
-                result = await coordinator.websocket.persist_plugin()
-                if result:
-                    await coordinator.websocket.request_info()
-                    _LOGGER.info("Plugin persisted")
-                else:
-                    _LOGGER.error("Failed to persist plugin via WebSocket")
-            else:
-                _LOGGER.warning("WebSocket not initialized for persist_plugin")
+    # The first refresh and the cache load run side by side. With a cached
+    # state entities are created right away and the refresh simply finishes
+    # in the background, so a slow or offline lamp no longer holds up (or
+    # fails) the setup
+    refresh_task = entry.async_create_background_task(
+        hass,
+        coordinator.async_timed_phase("first_refresh", coordinator.async_refresh()),
+        f"{DOMAIN}_refresh_{entry.entry_id}",
+    )
+    restored = (
+        await coordinator.async_timed_phase("cache_load", cache.async_load())
+        and coordinator.restore_from_cache()
+    )
+    if not restored:
+        await refresh_task
+        if not coordinator.last_update_success:
+            await session.close()
+            msg = f"Unable to fetch data from {entry.data[CONF_HOST]}"
+            raise ConfigEntryNotReady(msg) from coordinator.last_exception
+
+    _LOGGER.info("Successfully set up config entry for IKEA OBEGRÄNSAD Led.")
+    hass.data[DOMAIN_DATA].async_add(entry.entry_id, coordinator)
+    await hass.data[DOMAIN_DATA].async_update_notify_targets()
+
+    # Creazione automatica di input_text.ikea_message se non esiste
+    entity_id = "input_text.ikea_message"
+    name = "IKEA OBEGRÄNSAD Message"
+    if hass.states.get(entity_id) is None:
+        _LOGGER.info("Creating input_text.ikea_message entity.")
+        hass.states.async_set(entity_id, "", {"friendly_name": name})
+
+    # The WebSocket only needs the coordinator, so it connects while the
+    # platforms are being set up
+    websocket = IkeaObegransadWebSocket(entry.data[CONF_HOST], session)
+    coordinator.websocket = websocket
+    websocket.add_connection_callback(coordinator.handle_websocket_connection)
+
+    websocket.subscribe(coordinator.async_handle_info_event, "info")
+    coordinator.websocket_task = entry.async_create_background_task(
+        hass, websocket.listen_forever(), f"{DOMAIN}_websocket_{entry.entry_id}"
+    )
 
-        async def handle_clear_storage(call: ServiceCall) -> None:
-            """Handle clearing device storage."""
-            result = await client.clear_storage()
-            if result:
-                _LOGGER.info("Storage cleared")
-            else:
-                _LOGGER.error("Failed to clear storage")
+    weather_location = entry.data.get(CONF_WEATHER_LOCATION, "").strip()
 
-        async def handle_get_display_data(call: ServiceCall) -> None:
-            """Handle getting display data."""
-            data = await client.get_display_data()
-            if data:
-                _LOGGER.info("Retrieved %d bytes of display data", len(data))
-            else:
-                _LOGGER.error("Failed to get display data")
+    async def async_sync_weather_location() -> None:
+        """Push the configured weather location after the first refresh."""
+        await refresh_task
+        await coordinator.async_sync_weather_location(weather_location)
 
-        hass.services.async_register(DOMAIN, SERVICE_SEND_MESSAGE, handle_send_message)
-        hass.services.async_register(
-            DOMAIN, SERVICE_REMOVE_MESSAGE, handle_remove_message
-        )
-        hass.services.async_register(DOMAIN, SERVICE_SET_SCHEDULE, handle_set_schedule)
-        hass.services.async_register(
-            DOMAIN, SERVICE_START_SCHEDULE, handle_start_schedule
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_STOP_SCHEDULE, handle_stop_schedule
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_CLEAR_SCHEDULE, handle_clear_schedule
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_ROTATE_DISPLAY, handle_rotate_display
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_PERSIST_PLUGIN, handle_persist_plugin
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_CLEAR_STORAGE, handle_clear_storage
-        )
-        hass.services.async_register(
-            DOMAIN, SERVICE_GET_DISPLAY_DATA, handle_get_display_data
+    if weather_location:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_timed_phase(
+                "weather_location", async_sync_weather_location()
+            ),
+            f"{DOMAIN}_weather_location_{entry.entry_id}",
         )
 
-        return True
-
-    _LOGGER.error("Failed to set up entry because initial refresh failed.")
-    return False
+    await coordinator.async_timed_phase(
+        "platforms",
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+    )
+    coordinator.setup_timings["setup"] = round(time.monotonic() - setup_started, 3)
+    _LOGGER.debug("Setup timings: %s", coordinator.setup_timings)
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -324,21 +207,41 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         "Unloading config entry for IKEA OBEGRÄNSAD Led with entry ID: %s",
         entry.entry_id,
     )
-    coordinator = hass.data[DOMAIN].get(entry.entry_id)
-    if coordinator and coordinator.websocket_task:
-        coordinator.websocket_task.cancel()
-    if coordinator and coordinator.websocket:
-        await coordinator.websocket.disconnect()
-
+    # Tear down only once the platforms are gone; an entry that stays loaded
+    # keeps a working coordinator
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
         _LOGGER.debug("Successfully unloaded platform for entry ID: %s", entry.entry_id)
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].get(entry.entry_id)
+        if coordinator and coordinator.websocket:
+            # The drop must not schedule a refresh on a coordinator going away
+            coordinator.websocket.remove_connection_callback(
+                coordinator.handle_websocket_connection
+            )
+        if coordinator and coordinator.websocket_task:
+            coordinator.websocket_task.cancel()
+        if coordinator and coordinator.websocket:
+            await coordinator.websocket.disconnect()
+        if coordinator:
+            await coordinator.async_shutdown()
+        fleet = hass.data[DOMAIN_DATA]
+        fleet.async_remove(entry.entry_id)
+        await fleet.async_update_notify_targets()
+        if not fleet:
+            # No panel is left to take a frame
+            await fleet.video_wall.async_shutdown()
+        if coordinator:
+            await coordinator.client.session.close()
     else:
         _LOGGER.warning("Failed to unload platform for entry ID: %s", entry.entry_id)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached device state of a removed config entry."""
+    await IkeaObegransadStateCache(hass, entry.entry_id).async_remove()
+
+
 class IkeaObegransadLedDataUpdateCoordinator(DataUpdateCoordinator):
     """Data coordinator for IKEA OBEGRÄNSAD Led."""
 
@@ -347,6 +250,7 @@ class IkeaObegransadLedDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         client: IkeaObegransadLedApiClient,
         update_method: callable,
+        cache: IkeaObegransadStateCache | None = None,
     ) -> None:
         """
         Initialize the coordinator.
@@ -355,6 +259,7 @@ class IkeaObegransadLedDataUpdateCoordinator(DataUpdateCoordinator):
             hass: The Home Assistant instance.
             client: The IKEA OBEGRÄNSAD Led API client.
             update_method: The method to call for updates.
+            cache: Optional persistent cache of the last known state.
 
         """
         super().__init__(
@@ -365,103 +270,579 @@ class IkeaObegransadLedDataUpdateCoordinator(DataUpdateCoordinator):
             update_method=update_method,
         )
         self.client = client
-        self.plugin_map = {}
-        self.brightness = 0
-        self.is_on = False
-        self.active_plugin_id = None
-        self.active_effect_name = None
-        self.rotation = 0
-        self.persist_plugin = None
-        self.schedule_active = False
-        self.schedule = []
-        self.rows = 16
-        self.cols = 16
-        self.status = "NONE"
+        self.cache = cache
+        # Fraction of the poll interval this lamp polls at, set by the fleet
+        self.poll_phase: float | None = None
+        # Seconds spent in each setup phase, reported in diagnostics
+        self.setup_timings: dict[str, float] = {}
+        self.commands = IkeaObegransadCommandCoalescer()
+        self.transport_stats = {
+            transport: {
+                "commands": 0,
+                "failures": 0,
+                "last_latency": None,
+                "avg_latency": None,
+            }
+            for transport in (TRANSPORT_WEBSOCKET, TRANSPORT_REST)
+        }
+        self.plugin_catalog = EMPTY_CATALOG
+        self.state = DeviceState()
         self.websocket = None
         self.websocket_task = None
+        self._fallback_interval = FALLBACK_MIN_INTERVAL
+        self.changed_fields: set[str] = set()
+        self._info_received = asyncio.Event()
+        self._pending_info: dict[str, Any] | None = None
+        self._pending_info_at = 0.0
+        # Set while a refresh waits for the info event it requested
+        self._poll_awaiting_info = False
+        self._confirmed_state: DeviceState | None = None
+        self._expected: dict[str, Any] = {}
+        # When the newest optimistic change was applied
+        self._expected_since = 0.0
+        self._cancel_confirm_timer: Callable[[], None] | None = None
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUSH_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._async_push_pending_info,
+        )
+        self._notified_success = True
         self.weather_location = None
-        # Diagnostic attributes
-        self.wifi_rssi = None
-        self.uptime = None
-        self.free_memory = None
-        self.ip_address = None
-        self.mac_address = None
+        self._remove_breaker_listener = client.breaker.add_listener(
+            self._handle_breaker_state
+        )
         _LOGGER.debug("IkeaObegransadLedDataUpdateCoordinator initialized.")
 
-    def update_from_info(self, data: dict[str, Any]) -> None:
-        """Update coordinator state from info payload."""
-        self.plugin_map = {
-            plugin["name"]: plugin["id"] for plugin in data.get("plugins", [])
-        }
-        _LOGGER.debug("Plugin map updated: %s", self.plugin_map)
+    async def async_timed_phase(self, phase: str, awaitable: Awaitable[Any]) -> Any:
+        """Await a setup step and record how long it took in setup_timings."""
+        started = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.setup_timings[phase] = round(time.monotonic() - started, 3)
+
+    def _handle_breaker_state(self, state: str) -> None:
+        """Mark entities unavailable as soon as the client's circuit opens."""
+        if state == BREAKER_OPEN and self.last_update_success:
+            _LOGGER.warning("Device %s unreachable, failing fast", self.client.host)
+            self.last_update_success = False
+            self.async_update_listeners()
+        elif state == BREAKER_CLOSED and not self.last_update_success:
+            _LOGGER.info("Device %s reachable again", self.client.host)
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def fields_changed(self, fields: frozenset[str]) -> bool:
+        """
+        Return whether an entity reading the given fields needs to be written.
 
-        self.brightness = data.get("brightness", 0)
-        self.is_on = self.brightness > 0
-        self.active_plugin_id = data.get("plugin")
+        Availability changes always count, so entities declaring no fields are
+        only written when the device becomes available or unavailable.
+        """
+        changed = self.changed_fields
+        return FIELD_AVAILABLE in changed or not fields.isdisjoint(changed)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, then reset the set of changed fields."""
+        if self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            self.changed_fields.add(FIELD_AVAILABLE)
+        super().async_update_listeners()
+        self.changed_fields = set()
+
+    @property
+    def active_effect_name(self) -> str | None:
+        """Return the name of the active plugin."""
+        return self.plugin_catalog.name_for(self.state.plugin_id)
+
+    def update_from_info(
+        self, data: dict[str, Any], as_of: float | None = None
+    ) -> None:
+        """
+        Update coordinator state from info payload.
 
-        self.active_effect_name = next(
-            (
-                name
-                for name, plugin_id in self.plugin_map.items()
-                if plugin_id == self.active_plugin_id
-            ),
-            None,
+        Args:
+            data: The info payload reported by the device.
+            as_of: Monotonic time the payload is at least as new as. Payloads
+                older than the pending optimistic changes keep them laid over
+                instead of confirming or rolling them back.
+
+        """
+        # Keep the client's snapshot in step so reads between polls stay local
+        self.client.update_info_snapshot(data)
+        self._info_received.set()
+
+        signature = PluginCatalog.signature_of(data.get("plugins", []))
+        if signature != self.plugin_catalog.signature:
+            self.plugin_catalog = PluginCatalog.from_signature(
+                signature, self.plugin_catalog.version + 1
+            )
+            self.changed_fields.update((FIELD_PLUGIN_CATALOG, FIELD_ACTIVE_EFFECT))
+            _LOGGER.debug(
+                "Plugin catalog v%d: %s",
+                self.plugin_catalog.version,
+                self.plugin_catalog.options,
+            )
+
+        state = DeviceState.from_info(data)
+        self._confirmed_state = state
+        if self.cache is not None:
+            self.cache.async_update(info=self._cache_info(state))
+        if self._expected:
+            if as_of is not None and as_of < self._expected_since:
+                # Reported before the command; it neither confirms nor rejects it
+                state = state.with_info(self._expected)
+            else:
+                self._reconcile(state)
+        self._set_state(state)
+
+    def _cache_info(self, state: DeviceState) -> dict[str, Any]:
+        """Return an info payload for the cache rebuilt from a state."""
+        info = state.as_info()
+        info["plugins"] = [
+            {"id": plugin_id, "name": name}
+            for plugin_id, name in self.plugin_catalog.signature
+        ]
+        return info
+
+    def restore_from_cache(self) -> bool:
+        """
+        Seed the state, plugin catalog and config from the persistent cache.
+
+        The client's info snapshot is left empty so the first real read still
+        goes to the device.
+
+        Returns:
+            bool: True if the cached state was usable.
+
+        """
+        if self.cache is None or self.cache.info is None:
+            return False
+        if self._confirmed_state is not None:
+            # The device answered before the cache was read; keep live state
+            return True
+        info = self.cache.info
+        try:
+            catalog = PluginCatalog.from_plugins(info.get("plugins", []), 1)
+            state = DeviceState.from_info(info)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring unusable cached state: %s", err)
+            return False
+
+        self.plugin_catalog = catalog
+        self.state = state
+        self._confirmed_state = state
+        if self.cache.config:
+            self.update_from_config(self.cache.config)
+        self.data = state
+        _LOGGER.debug("Restored cached state for %s: %s", self.client.host, state)
+        return True
+
+    def _set_state(self, state: DeviceState) -> None:
+        """Replace the device state and record which fields changed."""
+        changed = self.state.diff(state)
+        if "plugin_id" in changed:
+            changed.add(FIELD_ACTIVE_EFFECT)
+        self.state = state
+        self.changed_fields.update(changed)
+        _LOGGER.debug("Changed fields: %s", self.changed_fields)
+
+    @callback
+    def async_apply_optimistic(self, changes: dict[str, Any]) -> None:
+        """
+        Show the expected result of a command before the device confirms it.
+
+        ``changes`` uses info payload keys (e.g. ``{"plugin": 3}``). They are
+        laid over the last confirmed payload and pushed to entities at once,
+        but never written into a payload, so the client snapshot and the cache
+        only ever hold what the device reported. The first info payload from
+        the WebSocket or a poll newer than the changes confirms them; if it
+        disagrees, its values win and the optimistic state is rolled back. When
+        nothing arrives within OPTIMISTIC_CONFIRM_TIMEOUT a refresh is requested.
+        """
+        if self._confirmed_state is None:
+            # Nothing to lay the changes over yet; the next refresh brings state
+            return
+        self._expected.update(changes)
+        self._expected_since = time.monotonic()
+        self._set_state(self._confirmed_state.with_info(self._expected))
+        self.async_update_listeners()
+
+        if self._cancel_confirm_timer is not None:
+            self._cancel_confirm_timer()
+        self._cancel_confirm_timer = async_call_later(
+            self.hass, OPTIMISTIC_CONFIRM_TIMEOUT, self._async_confirm_timeout
         )
 
-        self.rotation = data.get("rotation", 0)
-        self.persist_plugin = data.get("persist-plugin")
-        self.schedule_active = data.get("scheduleActive", False)
-        self.schedule = data.get("schedule", [])
-        self.rows = data.get("rows", 16)
-        self.cols = data.get("cols", 16)
-        self.status = data.get("status", "NONE")
-        
-        # Diagnostic information from device
-        self.wifi_rssi = data.get("rssi")
-        self.uptime = data.get("uptime")
-        self.free_memory = data.get("freeHeap")
-        self.ip_address = data.get("ipAddress")
-        self.mac_address = data.get("macAddress")
+    def _reconcile(self, state: DeviceState) -> None:
+        """Compare a confirmed state with the optimistic expectations."""
+        rolled_back = state.diff(state.with_info(self._expected))
+        if rolled_back:
+            _LOGGER.debug("Optimistic %s rolled back", sorted(rolled_back))
+        else:
+            _LOGGER.debug("Optimistic %s confirmed", self._expected)
+        self._expected = {}
+        if self._cancel_confirm_timer is not None:
+            self._cancel_confirm_timer()
+            self._cancel_confirm_timer = None
+
+    @callback
+    def _async_confirm_timeout(self, _now: Any) -> None:
+        """Request a deferred poll when optimistic state was not confirmed."""
+        self._cancel_confirm_timer = None
+        if self._expected:
+            _LOGGER.debug("Optimistic state unconfirmed, requesting refresh")
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_set_brightness(self, value: int) -> bool:
+        """Set the brightness, collapsing bursts into the newest value."""
+        return await self.commands.submit(
+            "brightness", value, self._async_route_brightness
+        )
+
+    async def async_set_plugin(self, plugin_id: int) -> bool:
+        """Set the active plugin, collapsing bursts into the newest value."""
+        return await self.commands.submit("plugin", plugin_id, self._async_route_plugin)
+
+    async def _async_route_brightness(self, value: int) -> bool:
+        """Send a brightness command over the best available transport."""
+        websocket = self.websocket
+        success = await self._async_route_command(
+            websocket.set_brightness if websocket else None,
+            self.client.set_brightness,
+            value,
+        )
+        if success:
+            self.async_apply_optimistic({"brightness": value})
+        return success
+
+    async def _async_route_plugin(self, plugin_id: int) -> bool:
+        """Send a plugin command over the best available transport."""
+        websocket = self.websocket
+        success = await self._async_route_command(
+            websocket.set_plugin if websocket else None,
+            self.client.set_plugin,
+            plugin_id,
+        )
+        if success:
+            self.async_apply_optimistic({"plugin": plugin_id})
+        return success
+
+    async def _async_route_command(
+        self,
+        ws_send: Callable[[Any], Awaitable[bool]] | None,
+        rest_send: Callable[[Any], Awaitable[dict[str, Any] | None]],
+        value: Any,
+    ) -> bool:
+        """
+        Send a command over the WebSocket, falling back to REST.
+
+        The open WebSocket avoids an HTTP request per command. If it is down,
+        the send fails or it does not complete within WS_COMMAND_TIMEOUT, the
+        command is sent through the REST client instead.
+        """
+        if ws_send is not None and self.websocket.connected:
+            started = time.monotonic()
+            try:
+                sent = await asyncio.wait_for(ws_send(value), WS_COMMAND_TIMEOUT)
+            except TimeoutError:
+                sent = False
+            self._record_transport(TRANSPORT_WEBSOCKET, started, success=sent)
+            if sent:
+                return True
+            _LOGGER.debug("WebSocket command failed, falling back to REST")
+
+        started = time.monotonic()
+        success = await rest_send(value) is not None
+        self._record_transport(TRANSPORT_REST, started, success=success)
+        return success
+
+    def _record_transport(
+        self, transport: str, started: float, *, success: bool
+    ) -> None:
+        """Record the outcome and latency of a command on a transport."""
+        stats = self.transport_stats[transport]
+        if not success:
+            stats["failures"] += 1
+            return
+        latency = time.monotonic() - started
+        stats["commands"] += 1
+        stats["last_latency"] = latency
+        stats["avg_latency"] = (
+            latency
+            if stats["avg_latency"] is None
+            else stats["avg_latency"] * 0.8 + latency * 0.2
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending commands and shut down the coordinator."""
+        await super().async_shutdown()
+        self._push_debouncer.async_cancel()
+        if self._cancel_confirm_timer is not None:
+            self._cancel_confirm_timer()
+            self._cancel_confirm_timer = None
+        self._remove_breaker_listener()
+        await self.commands.async_shutdown()
+
+    async def async_ensure_plugin(self, effect_name: str) -> bool:
+        """
+        Make sure the plugin with the given name is active.
+
+        The name is resolved through the cached plugin catalog and the switch is
+        skipped when the plugin is already active, so in the common case no
+        request reaches the device.
+
+        Args:
+            effect_name (str): The plugin name, compared case-insensitively.
+
+        Returns:
+            bool: True if the plugin is active, False otherwise.
+
+        """
+        plugin_id = self.plugin_catalog.id_for(effect_name)
+        if plugin_id is None:
+            _LOGGER.debug("Plugin %s not in cached index, asking device", effect_name)
+            plugin_id = await self.client.get_plugin_id_by_name(effect_name)
+            if plugin_id is None:
+                return False
+
+        if plugin_id == self.state.plugin_id:
+            _LOGGER.debug("Plugin %s already active, skipping switch", effect_name)
+            return True
+
+        return await self.async_set_plugin(plugin_id)
+
+    async def async_prepare_message(self) -> bool:
+        """
+        Switch to the message background effect unless it is already active.
+
+        Returns:
+            bool: True if the message background effect is active.
+
+        """
+        try:
+            if await self.async_ensure_plugin(CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT):
+                _LOGGER.debug("Animation set to DDP.")
+                return True
+        except aiohttp.ClientError:
+            _LOGGER.exception("Failed to change animation due to connection error")
+            return False
+        _LOGGER.warning("Could not switch %s to the message effect", self.client.host)
+        return False
+
+    async def async_show_message(self, **message: Any) -> dict[str, Any] | None:
+        """
+        Show a message on the lamp.
+
+        Args:
+            **message: The arguments of IkeaObegransadLedApiClient.send_message.
+
+        Returns:
+            dict | None: The response of the device, None if the send failed.
+
+        """
+        await self.async_prepare_message()
+        result = await self.client.send_message(**message)
+        _LOGGER.info(
+            "Message sent to IKEA OBEGRÄNSAD LED %s: %s",
+            self.client.host,
+            message.get("text"),
+        )
+        return result
 
     def update_from_config(self, data: dict[str, Any]) -> None:
         """Update coordinator state from config payload."""
-        self.weather_location = data.get("weatherLocation")
+        weather_location = data.get("weatherLocation")
+        if weather_location != self.weather_location:
+            self.changed_fields.add(FIELD_WEATHER_LOCATION)
+        self.weather_location = weather_location
+        if self.cache is not None:
+            self.cache.async_update(config={**(self.cache.config or {}), **data})
+
+    async def async_sync_weather_location(self, location: str) -> None:
+        """
+        Make sure the device uses the configured weather location.
+
+        The check runs once per setup against the live device config: the
+        cached one outlives a reflash or factory reset of the lamp, which
+        forgets the location. While the lamp is unreachable the check is
+        repeated after the next successful update.
+
+        Args:
+            location (str): The configured weather location.
+
+        """
+        while not await self._async_write_weather_location(location):
+            _LOGGER.debug("Weather location not synced, retrying once reachable")
+            await self._async_wait_for_update_success()
+
+    async def _async_write_weather_location(self, location: str) -> bool:
+        """Write the weather location if the device lost it; False on error."""
+        config = await self.client.get_config(max_age=0)
+        if config is None:
+            return False
+        if config.get("weatherLocation") != location:
+            if not await self.client.set_weather_location(location):
+                return False
+            config["weatherLocation"] = location
+        self.update_from_config(config)
+        self.async_update_listeners()
+        return True
+
+    async def _async_wait_for_update_success(self) -> None:
+        """Wait for the next update that reached the device."""
+        success = self.hass.loop.create_future()
+
+        @callback
+        def _async_check_update() -> None:
+            if self.last_update_success and not success.done():
+                success.set_result(None)
+
+        remove_listener = self.async_add_listener(_async_check_update)
+        try:
+            await success
+        finally:
+            remove_listener()
+
+    def handle_websocket_connection(self, *, connected: bool) -> None:
+        """Switch between push and polling when the WebSocket connects or drops."""
+        if connected:
+            _LOGGER.debug("WebSocket up, relying on push updates")
+            self.hass.async_create_task(self.websocket.request_info())
+            return
+        _LOGGER.debug("WebSocket down, resuming polling")
+        self._fallback_interval = FALLBACK_MIN_INTERVAL
+        self.update_interval = timedelta(seconds=FALLBACK_MIN_INTERVAL)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_handle_info_event(self, data: dict[str, Any]) -> None:
+        """
+        Queue a WebSocket info event for delivery to the entities.
+
+        The first event after a quiet period is pushed immediately; events
+        arriving within PUSH_DEBOUNCE_COOLDOWN of it are merged and pushed as a
+        single update at the end of the window. An event requested by a
+        refresh is left to that refresh, so it reaches the entities once.
+        """
+        if self._pending_info is None:
+            self._pending_info = dict(data)
+        else:
+            self._pending_info.update(data)
+        self._pending_info_at = time.monotonic()
+        # Waiting pollers and cached reads see the event without the delay
+        self.client.update_info_snapshot(dict(self._pending_info))
+        self._info_received.set()
+        if self._poll_awaiting_info:
+            return
+        await self._push_debouncer.async_call()
+
+    @callback
+    def _async_push_pending_info(self) -> None:
+        """Apply the merged info events and notify entities once."""
+        data, self._pending_info = self._pending_info, None
+        if data is None:
+            return
+        self.update_from_info(data, as_of=self._pending_info_at)
+        self.async_set_updated_data(self.state)
+
+    def _next_update_interval(self) -> timedelta:
+        """Return the poll interval to use after the current refresh."""
+        if self.websocket is not None and self.websocket.healthy(PUSH_HEALTHY_WINDOW):
+            return timedelta(seconds=self._staggered(SAFETY_POLL_INTERVAL))
+        interval = self._fallback_interval
+        self._fallback_interval = min(interval * 2, CONF_SCAN_INTERVAL)
+        return timedelta(seconds=self._staggered(interval))
+
+    def _staggered(self, interval: float) -> float:
+        """
+        Move the next poll onto this lamp's slot of the interval.
 
-    async def _async_update_data(self) -> dict[str, Any] | None:
+        Polls of a fleet are aligned to a wall clock grid of the interval,
+        each lamp offset by its poll_phase, so the lamps take turns instead of
+        polling at the same moment. The adjustment is at most half an interval.
+        """
+        if self.poll_phase is None:
+            return interval
+        target = time.time() + interval
+        delta = (self.poll_phase * interval - target) % interval
+        if delta > interval / 2:
+            delta -= interval
+        return interval + delta
+
+    async def _async_fetch_info(self) -> dict[str, Any] | None:
+        """
+        Fetch a fresh info payload, preferring the open WebSocket.
+
+        Asking for an info event over the WebSocket costs no HTTP request. The
+        event is taken from the pending push instead of being pushed as well,
+        so the refresh is the only update it causes. REST is used when the
+        socket is down or no event arrives in time.
+        """
+        websocket = self.websocket
+        if websocket is not None and websocket.connected:
+            self._info_received.clear()
+            self._poll_awaiting_info = True
+            try:
+                if await websocket.request_info():
+                    async with asyncio.timeout(WS_INFO_TIMEOUT):
+                        await self._info_received.wait()
+                    data, self._pending_info = self._pending_info, None
+                    if data is not None:
+                        return data
+                    # A push flushed in the meantime; its payload is the snapshot
+                    return await self.client.get_info()
+            except TimeoutError:
+                _LOGGER.debug("No WebSocket info event, polling over REST")
+            finally:
+                self._poll_awaiting_info = False
+
+        # Bypass the snapshot cache but still join any in-flight request
+        return await self.client.get_info(max_age=0)
+
+    async def _async_update_data(self) -> DeviceState:
         """
         Fetch data from the IKEA OBEGRÄNSAD Led API and update internal state.
 
         Returns:
-            Optional[Dict[str, Any]]: The data retrieved from the API, or None
-            if an error occurs or no data is returned.
+            DeviceState: The state parsed from the device info.
+
+        Raises:
+            UpdateFailed: If the device did not return any data, immediately so
+            while the client's circuit breaker is open.
 
         """
         _LOGGER.debug("Fetching data from IKEA OBEGRÄNSAD Led API.")
-        try:
-            data = await self.client.get_info()
-            if data:
-                self.update_from_info(data)
-
-                if not self.weather_location:
-                    config = await self.client.get_config()
-                    if config:
-                        self.update_from_config(config)
-
-                _LOGGER.debug(
-                    "Brightness updated to: %d, Lamp is on: %s, Plugin active is %d",
-                    self.brightness,
-                    self.is_on,
-                    self.active_plugin_id,
-                )
-                _LOGGER.debug(
-                    "Additional state - Rotation: %d, Schedule Active: %s, Status: %s",
-                    self.rotation,
-                    self.schedule_active,
-                    self.status,
-                )
-
-                return data
+        self.update_interval = self._next_update_interval()
+        requested_at = time.monotonic()
+        data = await self._async_fetch_info()
+        if not data:
+            if not self.client.available:
+                msg = f"{self.client.host} is unreachable, circuit open"
+            else:
+                msg = f"No info received from {self.client.host}"
+            raise UpdateFailed(msg)
 
-        except aiohttp.ClientError:
-            _LOGGER.exception("API connection error during update")
-            return None
+        self.update_from_info(data, as_of=requested_at)
+
+        if not self.weather_location:
+            # Served from the client's config cache between slow refreshes
+            config = await self.client.get_config()
+            if config:
+                self.update_from_config(config)
+
+        _LOGGER.debug(
+            "Brightness updated to: %s, Lamp is on: %s, Plugin active is %s",
+            self.state.brightness,
+            self.state.is_on,
+            self.state.plugin_id,
+        )
+        _LOGGER.debug(
+            "Additional state - Rotation: %s, Schedule Active: %s, Status: %s",
+            self.state.rotation,
+            self.state.schedule_active,
+            self.state.status,
+        )
+
+        return self.state
@@ -2,16 +2,25 @@
 A module provides an API client to control the IKEA OBEGRÄNSAD LED lamp via REST.
 
 Classes:
+    IkeaObegransadCircuitBreaker: Tracks reachability and fails requests fast.
     IkeaObegransadLedApiClient: API client to interact with the LED lamp.
 
 Constants:
-    TIMEOUT (int): The timeout duration for HTTP requests.
+    TIMEOUT (int): The default timeout duration for HTTP requests.
+    ENDPOINT_TIMEOUTS (dict): Shorter timeouts for specific endpoints.
+    INFO_CACHE_TTL (float): How long a device info snapshot is served from cache.
+    CONFIG_CACHE_TTL (float): How long the device config is served from cache.
     HEADERS (dict): The headers used for HTTP requests.
 
 Functions:
+    create_device_session(): Creates a keep-alive session dedicated to one lamp.
     __init__(self, session, host): Initializes the connection with the device host.
     _request(self, method, endpoint, params=None): Performs a generic HTTP request.
-    get_info(self): Retrieves information about the device.
+    get_info(self, max_age=INFO_CACHE_TTL): Retrieves information about the device,
+        sharing in-flight requests and serving recent snapshots from cache.
+    async_measure_rtt(self): Times a dedicated info request on the wire.
+    update_info_snapshot(self, info): Replaces the cached info snapshot.
+    invalidate_info(self): Drops the cached info snapshot.
     is_on(self): Checks if the light is on.
     turn_on(self): Turns on the device.
     turn_off(self): Turns off the device.
@@ -20,26 +29,154 @@ Functions:
     get_active_plugin(self): Retrieves the currently active plugin.
     set_brightness(self, value): Sets the LED display brightness.
     get_brightness(self): Retrieves the LED display brightness.
-    get_display_data(self): Retrieves the current LED display data.
+    get_display_data(self): Retrieves the raw LED display data.
     send_message(
         self, text=None, graph=None, repeat=1, delay=50, miny=None, maxy=None, id=None
     ): Sends a message to the display.
     remove_message(self, message_id: str): Removes a message from the LED display.
 """
 
+import asyncio
 import logging
+import random
+import time
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
 
+from .scheduler import (
+    MAX_CONCURRENT_REQUESTS,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_PREVIEW,
+    get_scheduler,
+)
+
 TIMEOUT = 10
 HTTP_OK = 200
+INFO_CACHE_TTL = 2.0
+CONFIG_CACHE_TTL = 3600
+
+# Per-endpoint total timeouts in seconds; anything else uses TIMEOUT
+ENDPOINT_TIMEOUTS = {
+    "info": 5,
+    "config": 5,
+    "data": 3,
+    "brightness": 3,
+    "plugin": 3,
+}
+_ENDPOINT_PRIORITIES = {
+    "info": PRIORITY_POLL,
+    "config": PRIORITY_POLL,
+    "data": PRIORITY_PREVIEW,
+}
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.25
+
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 30
+PROBE_TIMEOUT = 2
+
+# Scheduled requests plus the long-lived WebSocket and a breaker probe
+CONNECTION_LIMIT_PER_HOST = MAX_CONCURRENT_REQUESTS + 2
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Endpoints that never change device state and so keep the info snapshot valid
+_READ_ONLY_ENDPOINTS = frozenset({"info", "config", "data"})
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 
 
+def create_device_session() -> aiohttp.ClientSession:
+    """
+    Create a client session with a connection pool dedicated to one lamp.
+
+    Connections are kept alive between requests so the ESP32 does not pay for
+    a TCP handshake on every call, and resolved addresses are cached. The
+    caller owns the session and must close it, including when Home Assistant
+    shuts down.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+class IkeaObegransadCircuitBreaker:
+    """Circuit breaker tracking whether the device is reachable."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds to wait before probing an open circuit.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._listeners: list[Callable[[str], None]] = []
+
+    def add_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
+        """Register a callback for state changes and return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def probe_due(self) -> bool:
+        """Return True if an open circuit has waited long enough to be probed."""
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def half_open(self) -> None:
+        """Let a single probe request through."""
+        self._set_state(BREAKER_HALF_OPEN)
+
+    def record_success(self) -> None:
+        """Record a request that reached the device."""
+        self.failures = 0
+        self._set_state(BREAKER_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a request that could not reach the device."""
+        self.failures += 1
+        if self.state == BREAKER_OPEN:
+            # Late failures must not push the next probe further back
+            return
+        if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            if self.state == BREAKER_CLOSED:
+                self.trips += 1
+            self._set_state(BREAKER_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        """Change state and notify listeners."""
+        if state == self.state:
+            return
+        _LOGGER.debug("Circuit breaker %s -> %s", self.state, state)
+        self.state = state
+        for listener in list(self._listeners):
+            listener(state)
+
+
 class IkeaObegransadLedApiClient:
     """API client to control the LED lamp via REST."""
 
@@ -51,8 +188,22 @@ class IkeaObegransadLedApiClient:
         self.session = session
         self.host = host
         self.base_url = f"http://{host}/api"  # Use configured host
+        self._info_snapshot: dict[str, Any] | None = None
+        self._info_snapshot_time = 0.0
+        self._info_inflight: asyncio.Task | None = None
+        self.info_requests_saved = 0
+        self._config_snapshot: dict[str, Any] | None = None
+        self._config_snapshot_time = 0.0
+        self.breaker = IkeaObegransadCircuitBreaker()
+        self._probe_lock = asyncio.Lock()
+        self.scheduler = get_scheduler(host)
         _LOGGER.debug("Base URL set to: %s", self.base_url)
 
+    @property
+    def available(self) -> bool:
+        """Return False while the circuit breaker fails requests fast."""
+        return self.breaker.state != BREAKER_OPEN
+
     async def _request(
         self, method: str, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any] | None:
@@ -68,7 +219,8 @@ class IkeaObegransadLedApiClient:
         Returns:
             dict or None: The JSON response from the API if the request is successful
                 and the response is valid JSON.
-                None if the request fails or the response is not valid JSON.
+                None if the request fails, the response is not valid JSON or the
+                circuit breaker is open.
 
         Logs:
             - Request details including method, URL, and parameters.
@@ -78,74 +230,251 @@ class IkeaObegransadLedApiClient:
                 errors.
 
         """
-        url = f"{self.base_url}/{endpoint}"
         _LOGGER.debug(
-            "Making %s request to %s with params: %s", method, url, params
+            "Making %s request to %s/%s with params: %s",
+            method,
+            self.base_url,
+            endpoint,
+            params,
         )  # Log request details
-        try:
-            async with self.session.request(
-                method, url, params=params, timeout=TIMEOUT
-            ) as response:  # Add timeout
-                _LOGGER.debug(
-                    "Received response with status: %s from %s", response.status, url
-                )  # Log response status
-                if response.status == HTTP_OK:
-                    try:
-                        json_data = await response.json()
-                        _LOGGER.debug(
-                            "Successfully parsed JSON response: %s", json_data
-                        )  # Log JSON data
-                        return json_data  # noqa: TRY300
-                    except (
-                        aiohttp.ContentTypeError
-                    ):  # Handle potential JSON decode errors
-                        _LOGGER.exception(
-                            "Invalid JSON response from %s, %s", url, json_data
-                        )
-                        return None
-                else:
-                    text = await response.text()  # Get error text
-                    _LOGGER.error(
-                        "API Error %s from %s: %s", response.status, url, text
-                    )  # Log error details
-                    return None
-        except aiohttp.ClientError:
-            _LOGGER.exception("API connection error")  # Log connection errors
-            return None  # Important: Return None on error
+        return await self._async_send(method, endpoint, params=params)
 
     async def _request_json(
         self, method: str, endpoint: str, payload: dict[str, Any]
     ) -> dict[str, Any] | None:
         """Perform a JSON request with a body payload."""
+        _LOGGER.debug(
+            "Making %s request to %s/%s with json: %s",
+            method,
+            self.base_url,
+            endpoint,
+            payload,
+        )
+        return await self._async_send(method, endpoint, payload=payload)
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Send a request through the circuit breaker with retries.
+
+        Connection failures are retried with jittered exponential backoff when
+        repeating the request is safe: always if the connection was never
+        established, and for read-only endpoints also after a timeout. Every
+        attempt waits for a slot from the host's request scheduler at the
+        priority of its endpoint.
+
+        Returns:
+            The parsed JSON (or raw bytes when ``raw`` is set), or None on error.
+
+        """
         url = f"{self.base_url}/{endpoint}"
-        _LOGGER.debug("Making %s request to %s with json: %s", method, url, payload)
+        if not await self._async_allow_request():
+            _LOGGER.debug("Circuit open, failing fast for %s %s", method, url)
+            return None
+        read_only = method == "GET" and endpoint in _READ_ONLY_ENDPOINTS
+        if not read_only:
+            self.invalidate_info()
+
+        priority = _ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_COMMAND)
+        timeout = aiohttp.ClientTimeout(
+            total=ENDPOINT_TIMEOUTS.get(endpoint.split("/")[0], TIMEOUT)
+        )
+        attempt = 0
+        while True:
+            try:
+                async with self.scheduler.slot(priority) as granted:
+                    if not granted:
+                        return None
+                    async with self.session.request(
+                        method, url, params=params, json=payload, timeout=timeout
+                    ) as response:
+                        self.breaker.record_success()
+                        return await self._async_read_response(response, raw=raw)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                retryable = read_only or isinstance(err, aiohttp.ClientConnectorError)
+                if (
+                    retryable
+                    and attempt < MAX_RETRIES
+                    and self.breaker.state == BREAKER_CLOSED
+                ):
+                    delay = random.uniform(0, RETRY_BACKOFF * 2**attempt)  # noqa: S311
+                    attempt += 1
+                    _LOGGER.debug(
+                        "Retrying %s %s in %.2fs after error: %s",
+                        method,
+                        url,
+                        delay,
+                        err,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self.breaker.record_failure()
+                # Expected while the lamp is offline; a traceback adds nothing
+                _LOGGER.error(  # noqa: TRY400
+                    "API connection error for %s %s: %s", method, url, repr(err)
+                )
+                return None  # Important: Return None on error
+
+    async def _async_read_response(
+        self, response: aiohttp.ClientResponse, *, raw: bool
+    ) -> Any:
+        """Return the parsed body of a response, or None on an API error."""
+        _LOGGER.debug(
+            "Received response with status: %s from %s", response.status, response.url
+        )  # Log response status
+        if response.status != HTTP_OK:
+            text = await response.text()  # Get error text
+            _LOGGER.error(
+                "API Error %s from %s: %s", response.status, response.url, text
+            )  # Log error details
+            return None
+        if raw:
+            return await response.read()
+        try:
+            json_data = await response.json()
+        except aiohttp.ContentTypeError:
+            _LOGGER.exception("Invalid JSON response from %s", response.url)
+            return None
+        _LOGGER.debug("Successfully parsed JSON response: %s", json_data)
+        return json_data
+
+    async def _async_allow_request(self) -> bool:
+        """
+        Return whether a request may be sent, probing an open circuit if due.
+
+        While the circuit is half open only the probe reaches the device;
+        every other caller fails fast until the probe has closed the circuit.
+        """
+        if self.breaker.state == BREAKER_CLOSED:
+            return True
+        if self.breaker.state == BREAKER_HALF_OPEN or not self.breaker.probe_due():
+            return False
+        async with self._probe_lock:
+            # Another caller may have finished probing while we waited
+            if self.breaker.state == BREAKER_CLOSED:
+                return True
+            if not self.breaker.probe_due():
+                return False
+            return await self._async_probe()
+
+    async def _async_probe(self) -> bool:
+        """Send a single short info request to check if the device is back."""
+        self.breaker.half_open()
+        url = f"{self.base_url}/info"
+        _LOGGER.debug("Probing %s to close the circuit", url)
         try:
-            async with self.session.request(
-                method, url, json=payload, timeout=TIMEOUT
+            async with self.session.get(
+                url, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)
             ) as response:
-                _LOGGER.debug(
-                    "Received response with status: %s from %s", response.status, url
-                )
                 if response.status == HTTP_OK:
-                    try:
-                        return await response.json()
-                    except aiohttp.ContentTypeError:
-                        _LOGGER.exception("Invalid JSON response from %s", url)
-                        return None
-                text = await response.text()
-                _LOGGER.error("API Error %s from %s: %s", response.status, url, text)
-                return None
-        except aiohttp.ClientError:
-            _LOGGER.exception("API connection error")
-            return None
+                    self.breaker.record_success()
+                    return True
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Probe of %s failed: %s", url, err)
+        self.breaker.record_failure()
+        return False
+
+    async def get_info(self, max_age: float = INFO_CACHE_TTL) -> dict[str, Any] | None:
+        """
+        Retrieve information about the device.
+
+        Concurrent callers share a single in-flight ``GET /api/info`` and a
+        snapshot younger than ``max_age`` seconds is returned without touching
+        the device. Pass ``max_age=0`` to skip the cache while still joining a
+        request that is already running.
+
+        Args:
+            max_age (float): Maximum age in seconds of a cached snapshot.
+
+        Returns:
+            dict or None: The device info, or None if the request failed.
 
-    async def get_info(self) -> dict[str, Any] | None:
-        """Retrieve information about the device."""
-        _LOGGER.debug("Requesting device info from %s", self.base_url)
+        """
+        if (
+            self._info_snapshot is not None
+            and time.monotonic() - self._info_snapshot_time < max_age
+        ):
+            self.info_requests_saved += 1
+            _LOGGER.debug("Serving device info from snapshot cache")
+            return self._info_snapshot
+
+        task = self._info_inflight
+        if task is None:
+            _LOGGER.debug("Requesting device info from %s", self.base_url)
+            task = asyncio.create_task(self._async_fetch_info())
+            task.add_done_callback(self._clear_info_inflight)
+            self._info_inflight = task
+        else:
+            self.info_requests_saved += 1
+            _LOGGER.debug("Joining in-flight device info request")
+
+        # Shield so that a cancelled caller does not abort the shared request
+        return await asyncio.shield(task)
+
+    async def _async_fetch_info(self) -> dict[str, Any] | None:
+        """Fetch device info and store it as the current snapshot."""
         info = await self._request("GET", "info")
         _LOGGER.debug("Device info received: %s", info)
+        if info is not None:
+            self.update_info_snapshot(info)
         return info
 
+    async def async_measure_rtt(self) -> float | None:
+        """
+        Measure the round trip time of the device with a dedicated info request.
+
+        Unlike get_info the request is never shared with other callers, and the
+        clock starts once the scheduler has granted the slot, so the sample is
+        the time on the wire only. The answer refreshes the info snapshot.
+
+        Returns:
+            float | None: The round trip time in seconds, or None on error.
+
+        """
+        if not await self._async_allow_request():
+            return None
+        timeout = aiohttp.ClientTimeout(total=ENDPOINT_TIMEOUTS.get("info", TIMEOUT))
+        try:
+            async with self.scheduler.slot(PRIORITY_COMMAND) as granted:
+                if not granted:
+                    return None
+                started = time.monotonic()
+                async with self.session.get(
+                    f"{self.base_url}/info", timeout=timeout
+                ) as response:
+                    self.breaker.record_success()
+                    info = await self._async_read_response(response, raw=False)
+                rtt = time.monotonic() - started
+        except (aiohttp.ClientError, TimeoutError) as err:
+            self.breaker.record_failure()
+            _LOGGER.debug("Round trip probe to %s failed: %r", self.host, err)
+            return None
+        if info is None:
+            return None
+        self.update_info_snapshot(info)
+        return rtt
+
+    def _clear_info_inflight(self, task: asyncio.Task) -> None:
+        """Forget the in-flight info request once it completes."""
+        if self._info_inflight is task:
+            self._info_inflight = None
+
+    def update_info_snapshot(self, info: dict[str, Any]) -> None:
+        """Replace the cached info snapshot, e.g. with a WebSocket info event."""
+        self._info_snapshot = info
+        self._info_snapshot_time = time.monotonic()
+
+    def invalidate_info(self) -> None:
+        """Drop the cached info snapshot so the next read hits the device."""
+        self._info_snapshot = None
+
     async def is_on(self) -> bool:
         """Check if the light is on."""
         brightness = (
@@ -196,6 +525,8 @@ class IkeaObegransadLedApiClient:
         """Retrieve available plugins."""
         _LOGGER.debug("Requesting available plugins.")
         info = await self.get_info()  # Use get_info correctly
+        if not info:
+            return []
         plugins = info.get("plugins", [])
         _LOGGER.debug("Available plugins: %s", plugins)
         return plugins
@@ -204,6 +535,8 @@ class IkeaObegransadLedApiClient:
         """Retrieve the currently active plugin."""
         _LOGGER.debug("Requesting active plugin.")
         info = await self.get_info()  # Use get_info correctly
+        if not info:
+            return None
         active_plugin = info.get("plugin")
         _LOGGER.debug("Active plugin: %s", active_plugin)
         return active_plugin
@@ -217,15 +550,12 @@ class IkeaObegransadLedApiClient:
         """Retrieve the LED display brightness."""
         _LOGGER.debug("Requesting brightness value from the device.")
         info = await self.get_info()  # Use get_info correctly
+        if not info:
+            return 0
         brightness = info.get("brightness", 0)
         _LOGGER.debug("Brightness retrieved: %s", brightness)
         return brightness
 
-    async def get_display_data(self) -> dict[str, Any] | None:
-        """Retrieve the current LED display data."""
-        _LOGGER.debug("Requesting display data from the device.")
-        return await self._request("GET", "data")
-
     async def send_message(  # noqa: PLR0913
         self,
         text: str | None = None,
@@ -343,19 +673,50 @@ class IkeaObegransadLedApiClient:
         _LOGGER.debug("Clearing storage")
         return await self._request("GET", "storage/clear")
 
-    async def get_config(self) -> dict[str, Any] | None:
-        """Retrieve the device configuration."""
+    async def get_config(
+        self, max_age: float = CONFIG_CACHE_TTL
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve the device configuration.
+
+        The configuration rarely changes and is only written through this
+        client, so a copy younger than ``max_age`` seconds is served from cache.
+
+        Args:
+            max_age (float): Maximum age in seconds of the cached configuration.
+
+        """
+        if (
+            self._config_snapshot is not None
+            and time.monotonic() - self._config_snapshot_time < max_age
+        ):
+            _LOGGER.debug("Serving device config from cache")
+            return dict(self._config_snapshot)
         _LOGGER.debug("Requesting device config")
-        return await self._request("GET", "config")
+        config = await self._request("GET", "config")
+        if config is not None:
+            self._store_config(config)
+        return config
 
     async def set_config(self, config: dict[str, Any]) -> dict[str, Any] | None:
         """Update the device configuration."""
         _LOGGER.debug("Updating device config: %s", config)
-        return await self._request_json("POST", "config", config)
+        response = await self._request_json("POST", "config", config)
+        if response is not None:
+            self._store_config(config)
+        else:
+            self._config_snapshot = None
+        return response
+
+    def _store_config(self, config: dict[str, Any]) -> None:
+        """Remember a configuration known to match the device."""
+        self._config_snapshot = dict(config)
+        self._config_snapshot_time = time.monotonic()
 
     async def set_weather_location(self, location: str) -> bool:
         """Set weather location using the config API."""
-        config = await self.get_config()
+        # Read-modify-write needs the device's current config, not a cached one
+        config = await self.get_config(max_age=0)
         if not config:
             return False
         config["weatherLocation"] = location
@@ -371,17 +732,7 @@ class IkeaObegransadLedApiClient:
 
         """
         _LOGGER.debug("Getting display data")
-        url = f"{self.base_url}/data"
-        try:
-            async with self.session.request(
-                "GET", url, timeout=TIMEOUT
-            ) as response:
-                if response.status == HTTP_OK:
-                    data = await response.read()
-                    _LOGGER.debug("Retrieved display data: %d bytes", len(data))
-                    return data
-                _LOGGER.error("Failed to get display data: %s", response.status)
-                return None
-        except aiohttp.ClientError:
-            _LOGGER.exception("API connection error while getting display data")
-            return None
+        data = await self._async_send("GET", "data", raw=True)
+        if data is not None:
+            _LOGGER.debug("Retrieved display data: %d bytes", len(data))
+        return data
@@ -14,6 +14,7 @@ Functions:
 
 import logging
 from collections.abc import Callable
+from typing import ClassVar
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -32,6 +33,12 @@ class IkeaObegransadScheduleSensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for schedule status."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "schedule_active",
+            "schedule",
+        }
+    )
     _attr_device_class = BinarySensorDeviceClass.RUNNING
 
     def __init__(self, coordinator: CoordinatorEntity, entry: ConfigEntry) -> None:
@@ -40,19 +47,25 @@ class IkeaObegransadScheduleSensor(CoordinatorEntity, BinarySensorEntity):
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_schedule_active"
         self._attr_name = "Schedule Active"
+        self._attributes_state = None
+        self._attributes: dict = {}
 
     @property
     def is_on(self) -> bool:
         """Return true if the schedule is active."""
-        return self.coordinator.schedule_active
+        return self.coordinator.state.schedule_active
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        return {
-            "schedule": self.coordinator.schedule,
-            "schedule_count": len(self.coordinator.schedule),
-        }
+        """Return additional state attributes, rebuilt only for a new state."""
+        state = self.coordinator.state
+        if state is not self._attributes_state:
+            self._attributes_state = state
+            self._attributes = {
+                "schedule": list(state.schedule),
+                "schedule_count": len(state.schedule),
+            }
+        return self._attributes
 
     @property
     def device_info(self) -> dict:
@@ -68,7 +81,11 @@ class IkeaObegransadScheduleSensor(CoordinatorEntity, BinarySensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Schedule sensor update: %s", self.coordinator.schedule_active)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug(
+            "Schedule sensor update: %s", self.coordinator.state.schedule_active
+        )
         self.async_write_ha_state()
 
 
@@ -28,6 +28,7 @@ Functions:
 
 import logging
 from collections.abc import Callable
+from typing import ClassVar
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -44,6 +45,7 @@ class IkeaObegransadButtonEntity(CoordinatorEntity, ButtonEntity):
     """Base button entity for IKEA OBEGRÄNSAD LED."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset()
 
     def __init__(self, coordinator: CoordinatorEntity, entry: ConfigEntry) -> None:
         """Initialize the button entity."""
@@ -62,6 +64,12 @@ class IkeaObegransadButtonEntity(CoordinatorEntity, ButtonEntity):
             "configuration_url": f"http://{self.entry.data[CONF_HOST]}",
         }
 
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        self.async_write_ha_state()
+
 
 class IkeaObegransadRotateRightButton(IkeaObegransadButtonEntity):
     """Button to rotate display right."""
@@ -81,7 +89,6 @@ class IkeaObegransadRotateRightButton(IkeaObegransadButtonEntity):
             try:
                 result = await self.coordinator.websocket.rotate_display("right")
                 if result:
-                    await self.coordinator.websocket.request_info()
                     _LOGGER.info("Display rotated right")
                 else:
                     _LOGGER.error("Failed to rotate display right")
@@ -109,7 +116,6 @@ class IkeaObegransadRotateLeftButton(IkeaObegransadButtonEntity):
             try:
                 result = await self.coordinator.websocket.rotate_display("left")
                 if result:
-                    await self.coordinator.websocket.request_info()
                     _LOGGER.info("Display rotated left")
                 else:
                     _LOGGER.error("Failed to rotate display left")
@@ -137,7 +143,6 @@ class IkeaObegransadPersistPluginButton(IkeaObegransadButtonEntity):
             try:
                 result = await self.coordinator.websocket.persist_plugin()
                 if result:
-                    await self.coordinator.websocket.request_info()
                     _LOGGER.info("Plugin persisted")
                 else:
                     _LOGGER.error("Failed to persist plugin")
@@ -190,7 +195,7 @@ class IkeaObegransadStartScheduleButton(IkeaObegransadButtonEntity):
         try:
             result = await self.coordinator.client.start_schedule()
             if result:
-                await self.coordinator.async_request_refresh()
+                self.coordinator.async_apply_optimistic({"scheduleActive": True})
                 _LOGGER.info("Schedule started")
             else:
                 _LOGGER.error("Failed to start schedule")
@@ -215,7 +220,7 @@ class IkeaObegransadStopScheduleButton(IkeaObegransadButtonEntity):
         try:
             result = await self.coordinator.client.stop_schedule()
             if result:
-                await self.coordinator.async_request_refresh()
+                self.coordinator.async_apply_optimistic({"scheduleActive": False})
                 _LOGGER.info("Schedule stopped")
             else:
                 _LOGGER.error("Failed to stop schedule")
@@ -240,7 +245,9 @@ class IkeaObegransadClearScheduleButton(IkeaObegransadButtonEntity):
         try:
             result = await self.coordinator.client.clear_schedule()
             if result:
-                await self.coordinator.async_request_refresh()
+                self.coordinator.async_apply_optimistic(
+                    {"scheduleActive": False, "schedule": []}
+                )
                 _LOGGER.info("Schedule cleared")
             else:
                 _LOGGER.error("Failed to clear schedule")
@@ -0,0 +1,106 @@
+"""
+Persistent last-known-state cache for the IKEA OBEGRÄNSAD LED integration.
+
+The last confirmed info payload, including the plugin list, and the last known
+device config are written to Home Assistant storage. On the next start the
+coordinator is seeded from the cache so entities can be created without
+waiting for the lamp, which is then refreshed in the background.
+
+Classes:
+    IkeaObegransadStateCache: Per-entry store of the last known device state.
+
+Constants:
+    STORAGE_VERSION (int): Version of the stored data layout.
+    SAVE_DELAY (int): Seconds writes are delayed and batched by.
+"""
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# Diagnostics that change on every payload; persisting them would turn each
+# push into a disk write and their cached values are meaningless after a boot
+VOLATILE_INFO_KEYS = frozenset({"rssi", "uptime", "freeHeap"})
+
+
+class IkeaObegransadStateCache:
+    """Last known info payload and config of one device, kept in storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            hass (HomeAssistant): The Home Assistant instance.
+            entry_id (str): The config entry the cache belongs to.
+
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    @property
+    def info(self) -> dict[str, Any] | None:
+        """Return the cached info payload, if any."""
+        return self._data.get("info")
+
+    @property
+    def config(self) -> dict[str, Any] | None:
+        """Return the cached device config, if any."""
+        return self._data.get("config")
+
+    async def async_load(self) -> bool:
+        """
+        Load the cache from storage.
+
+        The load may finish after the first refresh has already stored fresh
+        values; those are newer than the stored ones and are kept.
+
+        Returns:
+            bool: True if a usable info payload was loaded.
+
+        """
+        data = await self._store.async_load()
+        if not isinstance(data, dict) or not isinstance(data.get("info"), dict):
+            _LOGGER.debug("No cached state for %s", self._store.key)
+            return False
+        self._data = {**data, **self._data}
+        return True
+
+    def async_update(
+        self,
+        *,
+        info: dict[str, Any] | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        """Store a new info payload and/or config, saving only on changes."""
+        changed = False
+        if info is not None:
+            info = {
+                key: value
+                for key, value in info.items()
+                if key not in VOLATILE_INFO_KEYS
+            }
+            if info != self._data.get("info"):
+                self._data["info"] = info
+                changed = True
+        if config is not None and config != self._data.get("config"):
+            self._data["config"] = config
+            changed = True
+        if changed:
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the cache from storage."""
+        self._data = {}
+        await self._store.async_remove()
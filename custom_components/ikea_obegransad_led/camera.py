@@ -4,18 +4,28 @@ Camera platform for IKEA OBEGRÄNSAD LED.
 This module provides a camera entity for the IKEA OBEGRÄNSAD LED integration.
 
 The camera entity displays a live preview of the 16x16 LED matrix display.
-It retrieves the raw pixel data from the device and converts it to a PNG image.
+While the WebSocket is connected and frames keep arriving it reads them from
+the shared frame buffer, rendering each frame at most once; the raw pixel data
+is fetched over HTTP when no streamed frame is younger than STREAM_MAX_AGE.
+
+Pillow is only imported when the first frame is rendered, in the executor, so
+loading the platform stays cheap when the camera is never viewed.
 
 Classes:
     IkeaObegransadScreenCamera: Camera entity for LED matrix preview.
 
 Functions:
     async_setup_entry: Sets up the camera platform.
+
+Constants:
+    STREAM_MAX_AGE (float): Seconds a streamed frame is used for the preview.
 """
 
+import importlib.util
 import logging
 from collections.abc import Callable
 from io import BytesIO
+from typing import ClassVar
 
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
@@ -23,20 +33,45 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_HOST, DOMAIN, VERSION
+from .framebuffer import FRAME_SIZE, IkeaObegransadFrameBuffer
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
-try:
+# Checked without importing the package
+PILLOW_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+# An older frame means the device stopped streaming; ask it over HTTP instead
+STREAM_MAX_AGE = 5.0
+
+
+def _render_frame(data: bytes) -> bytes:
+    """
+    Render 256 bytes of display data as an upscaled JPEG.
+
+    Runs in the executor; the Pillow import is paid once, on the first frame.
+    """
     from PIL import Image
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
+
+    # Convert 256 bytes to 16x16 grayscale image
+    # Each byte represents the brightness of one pixel (0-255)
+    img = Image.new("L", (16, 16))
+    img.putdata(list(data))
+
+    # Scale up for better visibility (16x16 -> 256x256)
+    scale = 16
+    img = img.resize((16 * scale, 16 * scale), Image.NEAREST)
+
+    # Convert to JPEG
+    output = BytesIO()
+    img.save(output, format="JPEG", quality=95)
+    return output.getvalue()
 
 
 class IkeaObegransadScreenCamera(CoordinatorEntity, Camera):
     """Camera entity for LED matrix preview."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset()
     _attr_icon = "mdi:camera"
     _attr_translation_key = "screen"
     _attr_supported_features = CameraEntityFeature.ON_OFF
@@ -49,6 +84,8 @@ class IkeaObegransadScreenCamera(CoordinatorEntity, Camera):
         self._attr_unique_id = f"{entry.entry_id}_screen_camera"
         self._attr_name = "Screen"
         self._frame_interval = 1.0  # Refresh every second
+        self._rendered_seq: int | None = None
+        self._rendered_image: bytes | None = None
 
     @property
     def device_info(self) -> dict:
@@ -70,44 +107,58 @@ class IkeaObegransadScreenCamera(CoordinatorEntity, Camera):
             _LOGGER.error("PIL/Pillow not available for camera image processing")
             return None
 
+        websocket = self.coordinator.websocket
+        if websocket is not None and websocket.connected:
+            age = websocket.frames.age
+            if age is not None and age < STREAM_MAX_AGE:
+                return await self._async_render_streamed(websocket.frames)
+
         try:
             # Get raw display data (256 bytes for 16x16 matrix)
             data = await self.coordinator.client.get_display_data()
             if not data:
                 _LOGGER.warning("Invalid display data: empty response")
                 return None
-            if len(data) != 256:
+            if len(data) != FRAME_SIZE:
                 _LOGGER.warning(
                     "Invalid display data: expected 256 bytes, got %s. "
                     "Normalizing to 256 bytes for preview.",
                     len(data),
                 )
-                if len(data) < 256:
-                    data = data.ljust(256, b"\x00")
+                if len(data) < FRAME_SIZE:
+                    data = data.ljust(FRAME_SIZE, b"\x00")
                 else:
-                    data = data[:256]
-
-            # Convert 256 bytes to 16x16 grayscale image
-            # Each byte represents the brightness of one pixel (0-255)
-            image_array = [data[i] for i in range(256)]
-            img = Image.new("L", (16, 16))
-            img.putdata(image_array)
-
-            # Scale up for better visibility (16x16 -> 256x256)
-            scale = 16
-            img = img.resize((16 * scale, 16 * scale), Image.NEAREST)
+                    data = data[:FRAME_SIZE]
 
-            # Convert to JPEG
-            output = BytesIO()
-            img.save(output, format="JPEG", quality=95)
-            return output.getvalue()
+            return await self.hass.async_add_executor_job(_render_frame, data)
 
         except Exception as e:
             _LOGGER.exception("Error generating camera image: %s", e)
             return None
 
+    async def _async_render_streamed(
+        self, frames: IkeaObegransadFrameBuffer
+    ) -> bytes | None:
+        """Render the latest streamed frame, reusing the image if unchanged."""
+        seq = frames.seq
+        if seq == self._rendered_seq:
+            return self._rendered_image
+        try:
+            # The executor needs a copy; the buffer changes with the next frame
+            image = await self.hass.async_add_executor_job(
+                _render_frame, frames.snapshot()
+            )
+        except Exception:
+            _LOGGER.exception("Error generating camera image")
+            return None
+        self._rendered_seq = seq
+        self._rendered_image = image
+        return image
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
         _LOGGER.debug("Screen camera update triggered")
         self.async_write_ha_state()
 
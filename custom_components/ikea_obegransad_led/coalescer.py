@@ -0,0 +1,135 @@
+"""
+Write-behind command coalescing for the IKEA OBEGRÄNSAD LED device.
+
+The lamp's microcontroller queues every REST command it receives, so a burst of
+intermediate values (e.g. while dragging the brightness slider) makes it lag for
+seconds. The coalescer keeps only the newest pending value per command kind and
+sends it at a bounded rate; values superseded before they were sent are never
+written and their callers receive the result of the write that replaced them.
+On shutdown the callers of pending and in-flight writes are cancelled, so no
+caller waits for a write that will never finish.
+
+Classes:
+    IkeaObegransadCommandCoalescer: Latest-wins, rate limited command writer.
+
+Constants:
+    COMMAND_MIN_INTERVAL (float): Minimum delay between two writes of a kind.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+COMMAND_MIN_INTERVAL = 0.2
+
+
+class IkeaObegransadCommandCoalescer:
+    """Latest-wins writer that collapses bursts of commands of the same kind."""
+
+    def __init__(self, min_interval: float = COMMAND_MIN_INTERVAL) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            min_interval (float): Minimum delay in seconds between two writes
+                of the same command kind.
+
+        """
+        self._min_interval = min_interval
+        self._pending: dict[
+            str,
+            tuple[Any, Callable[[Any], Awaitable[Any]], list[asyncio.Future]],
+        ] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        # Waiters of the write currently awaiting send(), per kind
+        self._in_flight: dict[str, list[asyncio.Future]] = {}
+        self._last_sent: dict[str, float] = {}
+        self.collapsed = 0
+
+    async def submit(
+        self, kind: str, value: Any, send: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """
+        Queue a value for writing and wait until it (or a newer one) is sent.
+
+        Args:
+            kind (str): The command kind, e.g. ``"brightness"`` or ``"plugin"``.
+            value (Any): The value to write.
+            send (Callable): Coroutine function performing the actual write.
+
+        Returns:
+            Any: The result of the write that carried this value or superseded it.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.get(kind)
+        if pending is None:
+            waiters = [future]
+        else:
+            waiters = pending[2]
+            waiters.append(future)
+            self.collapsed += 1
+            _LOGGER.debug("Superseding pending %s value %s", kind, pending[0])
+        self._pending[kind] = (value, send, waiters)
+
+        if kind not in self._workers:
+            self._workers[kind] = asyncio.create_task(self._async_drain(kind))
+        return await future
+
+    async def _async_drain(self, kind: str) -> None:
+        """Send the newest pending value of a kind until none are left."""
+        try:
+            while kind in self._pending:
+                delay = (
+                    self._last_sent.get(kind, 0.0)
+                    + self._min_interval
+                    - time.monotonic()
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                value, send, waiters = self._pending.pop(kind)
+                self._in_flight[kind] = waiters
+                _LOGGER.debug("Writing %s value %s", kind, value)
+                try:
+                    result = await send(value)
+                except asyncio.CancelledError:
+                    _cancel_waiters(waiters)
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+                finally:
+                    self._in_flight.pop(kind, None)
+                    self._last_sent[kind] = time.monotonic()
+        finally:
+            self._workers.pop(kind, None)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending and in-flight writes and stop all workers."""
+        for _value, _send, waiters in self._pending.values():
+            _cancel_waiters(waiters)
+        self._pending.clear()
+        for waiters in self._in_flight.values():
+            _cancel_waiters(waiters)
+        self._in_flight.clear()
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _cancel_waiters(waiters: list[asyncio.Future]) -> None:
+    """Cancel the callers still waiting for a write."""
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.cancel()
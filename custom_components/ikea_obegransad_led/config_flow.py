@@ -8,7 +8,8 @@ Classes:
 Functions:
     async_step_user: Handles a flow initialized by the user.
     _show_config_form: Shows the configuration form to edit location data.
-    _test_host: Tests if the provided host is valid.
+    _test_host: Tests if the provided host is valid and returns its info.
+    _verify_effect_exists: Checks the info payload for the message effect.
 
 Constants:
     DEFAULT_HOST: The default host for the ikea_obegransad_led integration.
@@ -20,9 +21,8 @@ from collections.abc import Coroutine
 import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from .api import IkeaObegransadLedApiClient
+from .api import IkeaObegransadLedApiClient, create_device_session
 from .const import (
     CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT,
     CONF_HOST,
@@ -73,10 +73,9 @@ class IkeaObegransadLedFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(host.lower())
             self._abort_if_unique_id_configured()
 
-            valid_host = await self._test_host(host)
-            if valid_host:
-                valid_effect = await self._verify_effect_exists(host, effect)
-                if valid_effect:
+            info = await self._test_host(host)
+            if info is not None:
+                if self._verify_effect_exists(info, effect):
                     return self.async_create_entry(
                         title=f"IKEA LED Matrix ({host})",
                         data=user_input,
@@ -114,60 +113,54 @@ class IkeaObegransadLedFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=self._errors,
         )
 
-    async def _test_host(self, host: str) -> bool:
+    async def _test_host(self, host: str) -> dict | None:
         """
         Test the connection to the given host.
 
-        This method attempts to establish a connection to the specified host
-        and checks if a valid response is received.
+        This method fetches the device info once over a short-lived dedicated
+        session; the returned payload is reused for the remaining checks.
 
         Args:
             host (str): The host address to test.
 
         Returns:
-            bool: True if the host is valid and a valid response is received,
-            False otherwise.
-
-        Raises:
-            aiohttp.ClientError: If there is a connection error.
-            Exception: If an unexpected error occurs.
+            dict | None: The device info if a valid response is received,
+            None otherwise.
 
         """
+        session = create_device_session()
         try:
             _LOGGER.debug("Testing connection to %s", host)
-            session = async_create_clientsession(self.hass)
             client = IkeaObegransadLedApiClient(session, host)
             response = await client.get_info()
 
             if response:
                 _LOGGER.debug("Received valid response: %s", response)
-                return True
+                return response
             _LOGGER.warning("Invalid response received: %s", response)
-            return False  # noqa: TRY300
-
-        except aiohttp.ClientError:
-            _LOGGER.exception("Connection error")
-            return False
-        except Exception:
-            _LOGGER.exception("Unexpected error")
-            return False
-
-    async def _verify_effect_exists(self, host: str, effect: str) -> bool:
-        try:
-            _LOGGER.debug("Testing connection to %s", host)
-            session = async_create_clientsession(self.hass)
-            client = IkeaObegransadLedApiClient(session, host)
-            response = await client.get_plugin_id_by_name(effect)
-
-            if response:
-                _LOGGER.debug("Effect name %s exists: %s", effect, response)
-                return True
-            _LOGGER.warning("Effect name %s does not exist: %s", effect, response)
-            return False  # noqa: TRY300
+            return None  # noqa: TRY300
 
         except aiohttp.ClientError:
             _LOGGER.exception("Connection error")
-            return False
+            return None
         except Exception:
             _LOGGER.exception("Unexpected error")
-            return False
+            return None
+        finally:
+            await session.close()
+
+    def _verify_effect_exists(self, info: dict, effect: str) -> bool:
+        """Check the device info for a plugin with the given name."""
+        plugin_id = next(
+            (
+                plugin.get("id")
+                for plugin in info.get("plugins", [])
+                if plugin.get("name", "").lower() == effect.lower()
+            ),
+            None,
+        )
+        if plugin_id is not None:
+            _LOGGER.debug("Effect name %s exists: %s", effect, plugin_id)
+            return True
+        _LOGGER.warning("Effect name %s does not exist", effect)
+        return False
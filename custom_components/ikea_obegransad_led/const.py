@@ -54,6 +54,7 @@ DEFAULT_NAME = "Ikea OBEGRÄNSAD LED Wall Light"
 
 # Service names
 SERVICE_SEND_MESSAGE = "send_message"
+SERVICE_BROADCAST_MESSAGE = "broadcast_message"
 SERVICE_REMOVE_MESSAGE = "remove_message"
 SERVICE_SET_SCHEDULE = "set_schedule"
 SERVICE_START_SCHEDULE = "start_schedule"
@@ -63,6 +64,8 @@ SERVICE_ROTATE_DISPLAY = "rotate_display"
 SERVICE_PERSIST_PLUGIN = "persist_plugin"
 SERVICE_CLEAR_STORAGE = "clear_storage"
 SERVICE_GET_DISPLAY_DATA = "get_display_data"
+SERVICE_SET_VIDEO_WALL = "set_video_wall"
+SERVICE_SHOW_VIDEO_WALL = "show_video_wall"
 
 # Service attributes
 ATTR_MESSAGE = "message"
@@ -74,6 +77,9 @@ ATTR_MINY = "miny"
 ATTR_MAXY = "maxy"
 ATTR_DIRECTION = "direction"
 ATTR_SCHEDULE = "schedule"
+ATTR_PANELS = "panels"
+ATTR_FRAME = "frame"
+ATTR_TEXT = "text"
 
 # Rotation directions
 DIRECTION_RIGHT = "right"
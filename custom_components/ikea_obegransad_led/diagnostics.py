@@ -0,0 +1,77 @@
+"""
+Diagnostics support for IKEA OBEGRÄNSAD LED.
+
+Reports the setup phase timings together with the runtime statistics the
+integration collects: the last device state, the request scheduler and circuit
+breaker, command coalescing, transport latencies and the WebSocket link.
+
+Functions:
+    async_get_config_entry_diagnostics: Returns diagnostics for a config entry.
+"""
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_HOST, DOMAIN, DOMAIN_DATA
+
+TO_REDACT = {CONF_HOST, "ipAddress", "macAddress"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    websocket = coordinator.websocket
+    now = time.monotonic()
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "setup_timings": coordinator.setup_timings,
+        "state": async_redact_data(coordinator.state.as_info(), TO_REDACT),
+        "plugin_catalog": {
+            "version": coordinator.plugin_catalog.version,
+            "plugins": len(coordinator.plugin_catalog),
+        },
+        "update_interval": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "last_update_success": coordinator.last_update_success,
+        "breaker": {
+            "state": client.breaker.state,
+            "failures": client.breaker.failures,
+            "trips": client.breaker.trips,
+        },
+        "scheduler": client.scheduler.as_dict(),
+        "info_requests_saved": client.info_requests_saved,
+        "commands_collapsed": coordinator.commands.collapsed,
+        "transports": coordinator.transport_stats,
+        "video_wall": hass.data[DOMAIN_DATA].video_wall.as_dict(),
+        "websocket": {
+            "connected": websocket is not None and websocket.connected,
+            "connected_for": (
+                round(now - websocket.connected_at, 1)
+                if websocket is not None and websocket.connected
+                else None
+            ),
+            "last_message_age": (
+                round(now - websocket.last_message_at, 1)
+                if websocket is not None and websocket.last_message_at
+                else None
+            ),
+            "queue_depth": websocket.queue_depth if websocket is not None else None,
+            "send": websocket.send_stats if websocket is not None else None,
+            "reconnects": websocket.reconnects if websocket is not None else None,
+            "heartbeat": websocket.heartbeat_stats if websocket is not None else None,
+            "handlers": websocket.dispatch_stats if websocket is not None else None,
+            "frames": websocket.frames.as_dict() if websocket is not None else None,
+            "commands": websocket.command_stats if websocket is not None else None,
+        },
+    }
@@ -0,0 +1,252 @@
+"""
+Fleet management for several IKEA OBEGRÄNSAD LED lamps.
+
+One fleet instance per Home Assistant owns the coordinator of every configured
+lamp. It resolves service call targets to coordinators, runs per-lamp work
+concurrently so one slow or offline lamp does not hold up the others, and
+spreads the lamps' polls over the poll interval so they do not all hit the
+Wi-Fi network at the same moment.
+
+Classes:
+    IkeaObegransadFleet: Registry of the coordinators of all lamps.
+
+Constants:
+    BROADCAST_RELEASE_MARGIN (float): Head start given to the release timers.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .videowall import IkeaObegransadVideoWall
+
+if TYPE_CHECKING:
+    from homeassistant.components.notify import BaseNotificationService
+
+    from . import IkeaObegransadLedDataUpdateCoordinator
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# Every kind of target a service call can carry
+_TARGET_ATTRS = (
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_AREA_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+
+# Time between scheduling a synchronized release and the earliest send, so
+# every lamp's timer is armed before the first one fires
+BROADCAST_RELEASE_MARGIN = 0.05
+
+
+class IkeaObegransadFleet:
+    """Owner of the coordinators of every configured lamp."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """
+        Initialize the fleet.
+
+        Args:
+            hass (HomeAssistant): The Home Assistant instance.
+
+        """
+        self.hass = hass
+        # Shared with hass.data[DOMAIN], where the platforms look coordinators up
+        self.coordinators: dict[str, IkeaObegransadLedDataUpdateCoordinator] = {}
+        self.video_wall = IkeaObegransadVideoWall(hass, self)
+        # Set once the notify platform is loaded
+        self.notify_service: BaseNotificationService | None = None
+
+    def __len__(self) -> int:
+        """Return the number of lamps in the fleet."""
+        return len(self.coordinators)
+
+    def async_add(
+        self, entry_id: str, coordinator: "IkeaObegransadLedDataUpdateCoordinator"
+    ) -> None:
+        """Add a lamp's coordinator to the fleet."""
+        self.coordinators[entry_id] = coordinator
+        self._assign_poll_phases()
+
+    def async_remove(
+        self, entry_id: str
+    ) -> "IkeaObegransadLedDataUpdateCoordinator | None":
+        """Remove a lamp's coordinator from the fleet and return it."""
+        coordinator = self.coordinators.pop(entry_id, None)
+        self._assign_poll_phases()
+        return coordinator
+
+    async def async_update_notify_targets(self) -> None:
+        """Register the per-lamp notify services again after lamps changed."""
+        if self.notify_service is not None:
+            await self.notify_service.async_register_services()
+
+    def _assign_poll_phases(self) -> None:
+        """Give every lamp its own, evenly spaced slot in the poll interval."""
+        count = len(self.coordinators)
+        for index, coordinator in enumerate(self.coordinators.values()):
+            # A single lamp keeps its unaligned timer
+            coordinator.poll_phase = index / count if count > 1 else None
+
+    async def async_targets(
+        self, call: ServiceCall
+    ) -> list["IkeaObegransadLedDataUpdateCoordinator"]:
+        """
+        Resolve the lamps a service call is aimed at.
+
+        Calls without any target address every lamp; a target that matches
+        none of the lamps resolves to an empty list, which callers reject.
+        """
+        if not any(call.data.get(attr) for attr in _TARGET_ATTRS):
+            return list(self.coordinators.values())
+        entry_ids = await async_extract_config_entry_ids(self.hass, call)
+        return [
+            coordinator
+            for entry_id, coordinator in self.coordinators.items()
+            if entry_id in entry_ids
+        ]
+
+    async def async_run(
+        self,
+        coordinators: Iterable["IkeaObegransadLedDataUpdateCoordinator"],
+        action: Callable[["IkeaObegransadLedDataUpdateCoordinator"], Awaitable[Any]],
+        lamp_timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run an action on several lamps concurrently.
+
+        Args:
+            coordinators (Iterable): The lamps to run the action on.
+            action (Callable): Coroutine function called with each coordinator.
+            lamp_timeout (float | None): Seconds after which a lamp's action is
+                abandoned, so a slow lamp cannot hold up the result of the rest.
+
+        Returns:
+            dict[str, Any]: The result per lamp host; a lamp whose action raised
+            maps to the exception, which is logged and not re-raised.
+
+        """
+        coordinators = list(coordinators)
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(action(coordinator), lamp_timeout)
+                for coordinator in coordinators
+            ),
+            return_exceptions=True,
+        )
+        outcome: dict[str, Any] = {}
+        for coordinator, result in zip(coordinators, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Action failed on %s: %r", coordinator.client.host, result
+                )
+            outcome[coordinator.client.host] = result
+        _LOGGER.debug(
+            "Ran action on %d lamps in %.3fs",
+            len(coordinators),
+            time.monotonic() - started,
+        )
+        return outcome
+
+    async def async_broadcast(
+        self,
+        coordinators: Iterable["IkeaObegransadLedDataUpdateCoordinator"],
+        prepare: Callable[["IkeaObegransadLedDataUpdateCoordinator"], Awaitable[Any]],
+        send: Callable[["IkeaObegransadLedDataUpdateCoordinator"], Awaitable[Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Prepare several lamps concurrently, then send to them in sync.
+
+        Every lamp is prepared (e.g. switched to the message plugin) and its
+        round trip time measured with a dedicated info request, which also
+        leaves a warm keep-alive connection behind. The sends are then released on a
+        shared schedule: each lamp's send is delayed by the difference between
+        the slowest lamp's one-way latency and its own, so the requests arrive
+        at the lamps together. Lamps that fail to prepare are not waited for.
+
+        Args:
+            coordinators (Iterable): The lamps to broadcast to.
+            prepare (Callable): Coroutine function readying one lamp; a false
+                result leaves the lamp out of the broadcast.
+            send (Callable): Coroutine function performing the send; a None
+                result counts as a failure.
+
+        Returns:
+            dict[str, dict]: Per lamp host the ``success`` flag, the measured
+            ``rtt``, the ``offset`` the send was delayed by and the send
+            ``latency``, all in milliseconds, or the ``error``.
+
+        """
+
+        async def async_prepare(
+            coordinator: "IkeaObegransadLedDataUpdateCoordinator",
+        ) -> float | None:
+            """Prepare one lamp and return its round trip time."""
+            if not await prepare(coordinator):
+                msg = "not ready"
+                raise RuntimeError(msg)
+            return await coordinator.client.async_measure_rtt()
+
+        coordinators = list(coordinators)
+        rtts = await self.async_run(coordinators, async_prepare)
+        results: dict[str, dict[str, Any]] = {}
+        ready = []
+        for coordinator in coordinators:
+            rtt = rtts[coordinator.client.host]
+            if isinstance(rtt, float):
+                ready.append((coordinator, rtt))
+            else:
+                results[coordinator.client.host] = {
+                    "success": False,
+                    "error": str(rtt) if rtt is not None else "unreachable",
+                }
+        if not ready:
+            return results
+
+        loop = asyncio.get_running_loop()
+        slowest = max(rtt for _coordinator, rtt in ready) / 2
+        release_at = loop.time() + BROADCAST_RELEASE_MARGIN
+
+        async def async_release(
+            coordinator: "IkeaObegransadLedDataUpdateCoordinator", rtt: float
+        ) -> None:
+            """Send to one lamp at its slot of the release schedule."""
+            offset = slowest - rtt / 2
+            await asyncio.sleep(max(0.0, release_at + offset - loop.time()))
+            started = time.monotonic()
+            error = None
+            try:
+                if await send(coordinator) is None:
+                    error = "no response"
+            except Exception as err:  # noqa: BLE001
+                error = str(err)
+            result = {
+                "success": error is None,
+                "rtt": round(rtt * 1000, 1),
+                "offset": round(offset * 1000, 1),
+                "latency": round((time.monotonic() - started) * 1000, 1),
+            }
+            if error is not None:
+                result["error"] = error
+            results[coordinator.client.host] = result
+
+        await asyncio.gather(
+            *(async_release(coordinator, rtt) for coordinator, rtt in ready)
+        )
+        _LOGGER.debug("Broadcast results: %s", results)
+        return results
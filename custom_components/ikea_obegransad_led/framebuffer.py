@@ -0,0 +1,103 @@
+"""
+Shared buffer for the display frames streamed by the IKEA OBEGRÄNSAD LED.
+
+The firmware pushes the content of its 16x16 matrix over the WebSocket as
+binary messages. Every frame is copied once, in place, into a buffer allocated
+when the connection is created and stamped with a sequence number and the time
+it arrived. Consumers (the camera, a recorder, analytics) subscribe to the
+``frame`` event of the WebSocket and receive the buffer itself rather than a
+copy; the sequence number tells them whether the content changed since they
+last looked.
+
+The buffer is cleared whenever the connection opens or closes, so a frame never
+outlives the connection it arrived on; the sequence number keeps counting so
+a consumer never mistakes a new frame for one it has already seen.
+
+The buffer is only written from the event loop, so it is stable while a
+consumer reads it without awaiting in between. A consumer that keeps a frame
+across an await, or hands it to the executor, takes a ``snapshot()``.
+
+Classes:
+    IkeaObegransadFrameBuffer: Latest display frame with sequence and time.
+
+Constants:
+    FRAME_SIZE (int): Bytes in one frame, one brightness value per pixel.
+    FRAME_EVENT (str): Dispatcher event under which frames are delivered.
+"""
+
+import logging
+import time
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+FRAME_SIZE = 256
+FRAME_EVENT = "frame"
+
+
+class IkeaObegransadFrameBuffer:
+    """Preallocated buffer holding the latest display frame of a lamp."""
+
+    def __init__(self) -> None:
+        """Initialize an empty frame buffer."""
+        self._buffer = bytearray(FRAME_SIZE)
+        # Read-only so subscribers cannot corrupt what the others see
+        self.view = memoryview(self._buffer).toreadonly()
+        self.seq = 0
+        self.timestamp: float | None = None
+        self.malformed = 0
+
+    @property
+    def has_frame(self) -> bool:
+        """Return True if a frame was received on the current connection."""
+        return self.timestamp is not None
+
+    @property
+    def age(self) -> float | None:
+        """Return the seconds since the latest frame arrived."""
+        if self.timestamp is None:
+            return None
+        return time.monotonic() - self.timestamp
+
+    def update(self, data: bytes, received_at: float) -> bool:
+        """
+        Store a frame received from the device.
+
+        Args:
+            data (bytes): The binary message payload.
+            received_at (float): Monotonic time the message was read.
+
+        Returns:
+            bool: True if the payload was a frame and was stored.
+
+        """
+        if len(data) != FRAME_SIZE:
+            self.malformed += 1
+            _LOGGER.debug(
+                "Ignoring binary message of %d bytes (expected %d)",
+                len(data),
+                FRAME_SIZE,
+            )
+            return False
+        self._buffer[:] = data
+        self.seq += 1
+        self.timestamp = received_at
+        return True
+
+    def reset(self) -> None:
+        """Forget the current frame; it belongs to a closed connection."""
+        self._buffer[:] = bytes(FRAME_SIZE)
+        self.timestamp = None
+
+    def snapshot(self) -> bytes:
+        """Return a copy of the current frame that later frames do not change."""
+        return bytes(self._buffer)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return frame statistics for diagnostics."""
+        age = self.age
+        return {
+            "seq": self.seq,
+            "age": round(age, 1) if age is not None else None,
+            "malformed": self.malformed,
+        }
@@ -39,6 +39,20 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
     """Representation of a IKEA OBEGRÄNSAD Led."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "brightness",
+            "plugin_catalog",
+            "plugin_id",
+            "rotation",
+            "persist_plugin",
+            "schedule_active",
+            "schedule",
+            "rows",
+            "cols",
+            "status",
+        }
+    )
     _attr_supported_color_modes: ClassVar[set[ColorMode]] = {ColorMode.BRIGHTNESS}
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_features = LightEntityFeature.EFFECT
@@ -48,18 +62,17 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
         super().__init__(coordinator)
         self.entry = entry
         self._name = DEFAULT_NAME
-        self._plugin_map = coordinator.plugin_map
-
         # Set initial state from coordinator
-        self._attr_is_on = coordinator.is_on
-        self._attr_brightness = coordinator.brightness
+        self._attr_is_on = coordinator.state.is_on
+        self._attr_brightness = coordinator.state.brightness
         self._attr_effect = coordinator.active_effect_name
-        self._attr_effect_list = (
-            list(coordinator.plugin_map.keys())
-            if coordinator.plugin_map
-            else DEFAULT_EFFECTS
+        self._catalog_version = coordinator.plugin_catalog.version
+        self._attr_effect_list = list(
+            coordinator.plugin_catalog.options or DEFAULT_EFFECTS
         )
         self._last_brightness = 0
+        self._attributes_state = None
+        self._attributes: dict = {}
 
     @property
     def icon(self) -> str:
@@ -70,16 +83,20 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
-        return {
-            "rotation": self.coordinator.rotation,
-            "persist_plugin": self.coordinator.persist_plugin,
-            "schedule_active": self.coordinator.schedule_active,
-            "schedule": self.coordinator.schedule,
-            "rows": self.coordinator.rows,
-            "cols": self.coordinator.cols,
-            "status": self.coordinator.status,
-        }
+        """Return additional state attributes, rebuilt only for a new state."""
+        state = self.coordinator.state
+        if state is not self._attributes_state:
+            self._attributes_state = state
+            self._attributes = {
+                "rotation": state.rotation,
+                "persist_plugin": state.persist_plugin,
+                "schedule_active": state.schedule_active,
+                "schedule": list(state.schedule),
+                "rows": state.rows,
+                "cols": state.cols,
+                "status": state.status,
+            }
+        return self._attributes
 
     @property
     def device_info(self) -> dict:
@@ -119,15 +136,15 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
         if not self._attr_effect:
             _LOGGER.debug(
                 "Effect is not set. Setting effect to %s.",
-                self.coordinator.active_plugin_id,
+                self.coordinator.state.plugin_id,
             )
-            _LOGGER.debug("Effect list: %s.", self._plugin_map)
+            _LOGGER.debug("Effect list: %s.", self._attr_effect_list)
             self._attr_effect = self.coordinator.active_effect_name
             _LOGGER.debug("Set effect to %s.", self._attr_effect)
 
         if "brightness" in kwargs:
             self._attr_is_on = True
-            await self.coordinator.client.set_brightness(kwargs["brightness"])
+            await self.coordinator.async_set_brightness(kwargs["brightness"])
             self._attr_brightness = kwargs["brightness"]
 
         # If effect is specified, update the effect
@@ -135,21 +152,21 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
             await self.async_set_effect(kwargs["effect"])
             if not self._attr_is_on:
                 if self._last_brightness:
-                    await self.coordinator.client.set_brightness(self._last_brightness)
+                    await self.coordinator.async_set_brightness(self._last_brightness)
                     self._attr_brightness = self._last_brightness
                 else:
-                    await self.coordinator.client.turn_on()
+                    await self.coordinator.async_set_brightness(255)
                     self._attr_brightness = 255
                 self._attr_is_on = True
 
         elif self._last_brightness:
             self._attr_is_on = True
-            await self.coordinator.client.set_brightness(self._last_brightness)
+            await self.coordinator.async_set_brightness(self._last_brightness)
             self._attr_brightness = self._last_brightness
 
         else:
             self._attr_is_on = True
-            await self.coordinator.client.turn_on()
+            await self.coordinator.async_set_brightness(255)
             self._attr_brightness = 255
 
         self.async_write_ha_state()
@@ -174,7 +191,7 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
         self._last_brightness = self._attr_brightness
         self._attr_is_on = False
         self._attr_brightness = 0
-        await self.coordinator.client.turn_off()
+        await self.coordinator.async_set_brightness(0)
 
         self.async_write_ha_state()
 
@@ -196,10 +213,10 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
         if effect_name:
             _LOGGER.debug("Setting effect %s.", effect_name)
             # Call the API or function to change the effect
-            effect_id = self.coordinator.plugin_map.get(effect_name)
+            effect_id = self.coordinator.plugin_catalog.by_name.get(effect_name)
             if effect_id is not None:
                 # Assuming your API supports setting effects by ID
-                success = await self.coordinator.client.set_plugin(effect_id)
+                success = await self.coordinator.async_set_plugin(effect_id)
                 if success:
                     self._attr_effect = effect_name
                     _LOGGER.info("Effect %s successfully applied.", effect_name)
@@ -212,23 +229,18 @@ class IkeaObegransadLedLight(CoordinatorEntity, LightEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
         _LOGGER.debug("Access to handle coordinator update.")
 
-        self._attr_brightness = self.coordinator.brightness
-        self._attr_is_on = self.coordinator.is_on
-        self._plugin_map = self.coordinator.plugin_map
-        self._attr_effect_list = list(self._plugin_map.keys()) or DEFAULT_EFFECTS
-
-        active_plugin_id = self.coordinator.active_plugin_id
+        self._attr_brightness = self.coordinator.state.brightness
+        self._attr_is_on = self.coordinator.state.is_on
+        catalog = self.coordinator.plugin_catalog
+        if catalog.version != self._catalog_version:
+            self._catalog_version = catalog.version
+            self._attr_effect_list = list(catalog.options or DEFAULT_EFFECTS)
 
-        self._attr_effect = next(
-            (
-                name
-                for name, plugin_id in self._plugin_map.items()
-                if plugin_id == active_plugin_id
-            ),
-            None,
-        )
+        self._attr_effect = self.coordinator.active_effect_name
         _LOGGER.debug("Active plugin set: %s", self._attr_effect)
 
         self.async_write_ha_state()
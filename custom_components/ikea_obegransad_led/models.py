@@ -0,0 +1,168 @@
+"""
+Data models for the IKEA OBEGRÄNSAD LED integration.
+
+Classes:
+    PluginCatalog: Immutable, versioned index of the firmware's plugins.
+    DeviceState: Immutable snapshot of the device state parsed from an info payload.
+
+Constants:
+    EMPTY_CATALOG: Catalog used before the first info payload arrives.
+    INFO_FIELDS: Info payload keys and the DeviceState fields they populate.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields, replace
+from types import MappingProxyType
+from typing import Any
+
+INFO_FIELDS: Mapping[str, str] = MappingProxyType(
+    {
+        "brightness": "brightness",
+        "plugin": "plugin_id",
+        "rotation": "rotation",
+        "persist-plugin": "persist_plugin",
+        "scheduleActive": "schedule_active",
+        "schedule": "schedule",
+        "rows": "rows",
+        "cols": "cols",
+        "status": "status",
+        "rssi": "wifi_rssi",
+        "uptime": "uptime",
+        "freeHeap": "free_memory",
+        "ipAddress": "ip_address",
+        "macAddress": "mac_address",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PluginCatalog:
+    """
+    Immutable index of the plugins reported by the firmware.
+
+    A catalog is only rebuilt when the firmware's plugin list changes, which
+    bumps its version; entities can therefore share one instance and compare
+    catalogs by identity or version instead of by content.
+    """
+
+    version: int
+    signature: tuple[tuple[int, str], ...]
+    by_name: Mapping[str, int]
+    by_id: Mapping[int, str]
+    by_lower_name: Mapping[str, int]
+    options: tuple[str, ...]
+
+    @classmethod
+    def from_plugins(
+        cls, plugins: Iterable[dict[str, Any]], version: int
+    ) -> "PluginCatalog":
+        """
+        Build a catalog from the ``plugins`` list of an info payload.
+
+        Args:
+            plugins (Iterable[dict]): Items with ``id`` and ``name`` keys.
+            version (int): The version number of the new catalog.
+
+        """
+        return cls.from_signature(cls.signature_of(plugins), version)
+
+    @classmethod
+    def from_signature(
+        cls, signature: tuple[tuple[int, str], ...], version: int
+    ) -> "PluginCatalog":
+        """Build a catalog from ``(id, name)`` pairs."""
+        return cls(
+            version=version,
+            signature=signature,
+            by_name=MappingProxyType({name: pid for pid, name in signature}),
+            by_id=MappingProxyType(dict(signature)),
+            by_lower_name=MappingProxyType(
+                {name.lower(): pid for pid, name in signature}
+            ),
+            options=tuple(name for _pid, name in signature),
+        )
+
+    @staticmethod
+    def signature_of(plugins: Iterable[dict[str, Any]]) -> tuple[tuple[int, str], ...]:
+        """Return the ``(id, name)`` pairs identifying a plugin list."""
+        return tuple((plugin["id"], plugin["name"]) for plugin in plugins)
+
+    def id_for(self, name: str) -> int | None:
+        """Return the id of a plugin by name, compared case-insensitively."""
+        return self.by_lower_name.get(name.lower())
+
+    def name_for(self, plugin_id: int | None) -> str | None:
+        """Return the name of a plugin by id."""
+        return self.by_id.get(plugin_id)
+
+    def __len__(self) -> int:
+        """Return the number of plugins in the catalog."""
+        return len(self.options)
+
+
+EMPTY_CATALOG = PluginCatalog.from_signature((), 0)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceState:
+    """
+    Immutable snapshot of the device state.
+
+    Built once per info payload; the raw payload is not kept. Entities read
+    the fields directly and two states are compared field by field to find
+    what changed.
+    """
+
+    brightness: int = 0
+    plugin_id: int | None = None
+    rotation: int = 0
+    persist_plugin: int | None = None
+    schedule_active: bool = False
+    schedule: tuple[dict[str, Any], ...] = ()
+    rows: int = 16
+    cols: int = 16
+    status: str = "NONE"
+    # Diagnostic information from device
+    wifi_rssi: int | None = None
+    uptime: int | None = None
+    free_memory: int | None = None
+    ip_address: str | None = None
+    mac_address: str | None = None
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the display is lit."""
+        return bool(self.brightness)
+
+    @classmethod
+    def from_info(cls, data: Mapping[str, Any]) -> "DeviceState":
+        """Parse an info payload; keys missing from it keep their defaults."""
+        return cls().with_info(data)
+
+    def with_info(self, changes: Mapping[str, Any]) -> "DeviceState":
+        """Return a copy with the given info payload keys applied."""
+        return self._with_values(changes)
+
+    def as_info(self) -> dict[str, Any]:
+        """Return the state as info payload keys, the inverse of from_info."""
+        info = {key: getattr(self, field) for key, field in INFO_FIELDS.items()}
+        info["schedule"] = list(self.schedule)
+        return info
+
+    def _with_values(self, data: Mapping[str, Any]) -> "DeviceState":
+        """Return a copy with the known info payload keys of ``data`` applied."""
+        values = {field: data[key] for key, field in INFO_FIELDS.items() if key in data}
+        if "schedule" in values:
+            values["schedule"] = tuple(values["schedule"] or ())
+        return replace(self, **values) if values else self
+
+    def diff(self, other: "DeviceState") -> set[str]:
+        """Return the names of the fields that differ from another state."""
+        return {
+            name
+            for name in _DEVICE_STATE_FIELDS
+            if getattr(self, name) != getattr(other, name)
+        }
+
+
+_DEVICE_STATE_FIELDS = tuple(field.name for field in fields(DeviceState))
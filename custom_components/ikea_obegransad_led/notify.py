@@ -4,9 +4,13 @@ Notify platform for IKEA OBEGRÄNSAD LED.
 This module provides a notify service for the IKEA OBEGRÄNSAD LED integration.
 
 The notify service allows sending messages to the LED display using the standard
-Home Assistant notification framework.
+Home Assistant notification framework. Messages go to every configured lamp, or
+to the lamps given as targets (entry id, host or the target slug), concurrently;
+a slow or offline lamp is given up on after NOTIFY_TIMEOUT without holding up
+the others.
 
 Service: notify.ikea_obegransad_led
+Per lamp: notify.ikea_obegransad_led_<host>, added and removed with the lamps
 
 Message format:
 {
@@ -34,24 +38,58 @@ from typing import Any
 
 from homeassistant.components.notify import (
     ATTR_DATA,
+    ATTR_TARGET,
     BaseNotificationService,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .const import DOMAIN_DATA
+from .fleet import IkeaObegransadFleet
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+NOTIFY_TIMEOUT = 15
+
 
 class IkeaObegransadNotifyService(BaseNotificationService):
     """Notify service for IKEA OBEGRÄNSAD LED."""
 
-    def __init__(self, coordinator: Any) -> None:
+    def __init__(self, fleet: IkeaObegransadFleet) -> None:
         """Initialize the notify service."""
-        self.coordinator = coordinator
+        self.fleet = fleet
         _LOGGER.debug("IkeaObegransadNotifyService initialized")
 
+    @property
+    def targets(self) -> dict[str, str]:
+        """Return the lamps as notify targets, keyed by their host slug."""
+        return {
+            slugify(coordinator.client.host): entry_id
+            for entry_id, coordinator in self.fleet.coordinators.items()
+        }
+
+    def _resolve_targets(self, targets: list[str] | None) -> list[Any]:
+        """Return the coordinators for the given targets, all lamps if None."""
+        if not targets:
+            return list(self.fleet.coordinators.values())
+        by_target = {}
+        for entry_id, coordinator in self.fleet.coordinators.items():
+            for key in (
+                entry_id,
+                coordinator.client.host,
+                slugify(coordinator.client.host),
+            ):
+                by_target[key] = coordinator
+        resolved = []
+        for target in targets:
+            coordinator = by_target.get(target)
+            if coordinator is None:
+                _LOGGER.warning("Unknown IKEA OBEGRÄNSAD LED notify target: %s", target)
+            elif coordinator not in resolved:
+                resolved.append(coordinator)
+        return resolved
+
     async def async_send_message(self, message: str = "", **kwargs: Any) -> None:
         """
         Send a message to the IKEA OBEGRÄNSAD LED display.
@@ -92,16 +130,15 @@ class IkeaObegransadNotifyService(BaseNotificationService):
                 _LOGGER.error("Invalid graph format: %s", graph_str)
                 graph = None
 
-        try:
-            # Switch to DDP plugin for displaying messages
-            from .const import CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT
-
-            await self.coordinator.client.set_plugin_by_name(
-                CONF_DEFAULT_MESSAGE_BACKGROUND_EFFECT
-            )
+        coordinators = self._resolve_targets(kwargs.get(ATTR_TARGET))
+        if not coordinators:
+            _LOGGER.error("No IKEA OBEGRÄNSAD LED lamp to notify")
+            return
 
-            # Send the message
-            await self.coordinator.client.send_message(
+        # Each lamp skips the switch to DDP when its cached state shows it active
+        results = await self.fleet.async_run(
+            coordinators,
+            lambda coordinator: coordinator.async_show_message(
                 text=message,
                 repeat=repeat,
                 delay=delay,
@@ -109,15 +146,23 @@ class IkeaObegransadNotifyService(BaseNotificationService):
                 miny=miny,
                 maxy=maxy,
                 message_id=message_id,
-            )
-            _LOGGER.info(
-                "Message sent to IKEA OBEGRÄNSAD LED: %s (repeat: %d, delay: %d)",
-                message,
-                repeat,
-                delay,
-            )
-        except Exception as e:
-            _LOGGER.exception("Failed to send message to IKEA OBEGRÄNSAD LED: %s", e)
+            ),
+            lamp_timeout=NOTIFY_TIMEOUT,
+        )
+        delivered = [
+            host
+            for host, result in results.items()
+            if result is not None and not isinstance(result, Exception)
+        ]
+        _LOGGER.info(
+            "Message delivered to %d of %d IKEA OBEGRÄNSAD LED lamps: %s "
+            "(repeat: %d, delay: %d)",
+            len(delivered),
+            len(results),
+            message,
+            repeat,
+            delay,
+        )
 
 
 async def async_get_service(
@@ -128,15 +173,12 @@ async def async_get_service(
     """Return the notify service."""
     _LOGGER.debug("Setting up IKEA OBEGRÄNSAD LED notify service")
 
-    if DOMAIN not in hass.data or not hass.data[DOMAIN]:
+    if DOMAIN_DATA not in hass.data:
         _LOGGER.error("IKEA OBEGRÄNSAD LED integration not configured")
         return None
 
-    # Get the first (and usually only) coordinator
-    coordinators = list(hass.data[DOMAIN].values())
-    if not coordinators:
-        _LOGGER.error("No coordinators found")
-        return None
-
-    coordinator = coordinators[0]
-    return IkeaObegransadNotifyService(coordinator)
+    # Lamps are looked up per message, so lamps set up later are reached too;
+    # the fleet re-registers the per-lamp services when lamps come and go
+    fleet = hass.data[DOMAIN_DATA]
+    fleet.notify_service = IkeaObegransadNotifyService(fleet)
+    return fleet.notify_service
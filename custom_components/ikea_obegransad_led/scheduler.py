@@ -0,0 +1,174 @@
+"""
+Prioritized request scheduling for the IKEA OBEGRÄNSAD LED device.
+
+The firmware's web server only handles a few concurrent connections. All REST
+traffic to a host therefore goes through one scheduler that caps the number of
+requests in flight and hands free slots out by priority: user commands before
+state polls, state polls before camera preview fetches. Preview fetches are
+shed when the queue is already long, since a newer frame will follow anyway.
+
+Classes:
+    IkeaObegransadRequestScheduler: Per-host request slot scheduler.
+
+Functions:
+    get_scheduler: Returns the shared scheduler for a host.
+
+Constants:
+    PRIORITY_COMMAND (int): Priority of user commands.
+    PRIORITY_POLL (int): Priority of state and config reads.
+    PRIORITY_PREVIEW (int): Priority of camera preview fetches.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_PREVIEW = 2
+PRIORITY_NAMES = {
+    PRIORITY_COMMAND: "command",
+    PRIORITY_POLL: "poll",
+    PRIORITY_PREVIEW: "preview",
+}
+
+MAX_CONCURRENT_REQUESTS = 2
+SHED_QUEUE_DEPTH = 3
+SLOW_WAIT_THRESHOLD = 0.5
+
+_SCHEDULERS: dict[str, "IkeaObegransadRequestScheduler"] = {}
+
+
+def get_scheduler(host: str) -> "IkeaObegransadRequestScheduler":
+    """Return the scheduler shared by every client talking to the given host."""
+    key = host.lower()
+    if key not in _SCHEDULERS:
+        _SCHEDULERS[key] = IkeaObegransadRequestScheduler()
+    return _SCHEDULERS[key]
+
+
+class IkeaObegransadRequestScheduler:
+    """Bounded-concurrency scheduler granting request slots by priority."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        shed_queue_depth: int = SHED_QUEUE_DEPTH,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent (int): Maximum number of requests in flight.
+            shed_queue_depth (int): Queue depth at which preview requests are
+                rejected instead of queued.
+
+        """
+        self._max_concurrent = max_concurrent
+        self._shed_queue_depth = shed_queue_depth
+        self._active = 0
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self.max_queue_depth = 0
+        self.shed = 0
+        self.stats = {
+            name: {"requests": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for _prio, _seq, fut in self._queue if not fut.done())
+
+    @property
+    def active(self) -> int:
+        """Return the number of requests currently in flight."""
+        return self._active
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return scheduler statistics for diagnostics."""
+        return {
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "shed": self.shed,
+            "priorities": self.stats,
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[bool]:
+        """
+        Hold a request slot for the duration of the context.
+
+        Yields:
+            bool: True if a slot was granted, False if the request was shed.
+
+        """
+        if not await self._async_acquire(priority):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> bool:
+        """Wait for a free slot, returning False if the request is shed."""
+        name = PRIORITY_NAMES.get(priority, "command")
+        if self._active < self._max_concurrent and not self.queue_depth:
+            self._active += 1
+            self._record_wait(name, 0.0)
+            return True
+
+        depth = self.queue_depth
+        if priority >= PRIORITY_PREVIEW and depth >= self._shed_queue_depth:
+            self.shed += 1
+            _LOGGER.debug("Shedding %s request, queue depth %d", name, depth)
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self.max_queue_depth = max(self.max_queue_depth, depth + 1)
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+        waited = time.monotonic() - started
+        self._record_wait(name, waited)
+        if waited >= SLOW_WAIT_THRESHOLD:
+            _LOGGER.debug(
+                "%s request waited %.2fs for a slot (queue depth %d)",
+                name,
+                waited,
+                depth + 1,
+            )
+        return True
+
+    def _release(self) -> None:
+        """Hand the slot to the most urgent waiter or free it."""
+        while self._queue:
+            _priority, _sequence, future = heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, name: str, waited: float) -> None:
+        """Record how long a request waited for its slot."""
+        stats = self.stats[name]
+        stats["requests"] += 1
+        stats["total_wait"] += waited
+        stats["max_wait"] = max(stats["max_wait"], waited)
@@ -15,6 +15,7 @@ Functions:
 
 import logging
 from collections.abc import Callable
+from typing import ClassVar
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -30,6 +31,12 @@ class IkeaObegransadPluginSelect(CoordinatorEntity, SelectEntity):
     """Select entity for choosing active plugin."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "active_effect_name",
+            "plugin_catalog",
+        }
+    )
     _attr_icon = "mdi:format-list-bulleted"
     _attr_translation_key = "plugin"
 
@@ -39,6 +46,8 @@ class IkeaObegransadPluginSelect(CoordinatorEntity, SelectEntity):
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_plugin_select"
         self._attr_name = "Plugin"
+        self._catalog_version: int | None = None
+        self._options: list[str] = []
 
     @property
     def current_option(self) -> str | None:
@@ -47,15 +56,20 @@ class IkeaObegransadPluginSelect(CoordinatorEntity, SelectEntity):
 
     @property
     def options(self) -> list[str]:
-        """Return list of available plugins."""
-        return list(self.coordinator.plugin_map.keys())
+        """Return the available plugins from the shared catalog."""
+        catalog = self.coordinator.plugin_catalog
+        # The list is only rebuilt when a new catalog version is published
+        if catalog.version != self._catalog_version:
+            self._catalog_version = catalog.version
+            self._options = list(catalog.options)
+        return self._options
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected plugin."""
         try:
-            result = await self.coordinator.client.set_plugin_by_name(option)
+            # The coordinator applies the new plugin optimistically on success
+            result = await self.coordinator.async_ensure_plugin(option)
             if result:
-                await self.coordinator.async_request_refresh()
                 _LOGGER.info("Plugin changed to: %s", option)
             else:
                 _LOGGER.error("Failed to change plugin to: %s", option)
@@ -76,10 +90,12 @@ class IkeaObegransadPluginSelect(CoordinatorEntity, SelectEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
         _LOGGER.debug(
             "Plugin select update - current: %s, available: %s",
             self.coordinator.active_effect_name,
-            list(self.coordinator.plugin_map.keys()),
+            self.coordinator.plugin_catalog.options,
         )
         self.async_write_ha_state()
 
@@ -33,6 +33,7 @@ Functions:
 
 import logging
 from collections.abc import Callable
+from typing import ClassVar
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -56,6 +57,7 @@ class IkeaObegransadRotationSensor(CoordinatorEntity, SensorEntity):
     """Sensor for display rotation."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"rotation"})
     _attr_icon = "mdi:screen-rotation"
     _attr_translation_key = "rotation"
 
@@ -69,7 +71,7 @@ class IkeaObegransadRotationSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return the current rotation."""
-        return ROTATION_MAP.get(self.coordinator.rotation, "Unknown")
+        return ROTATION_MAP.get(self.coordinator.state.rotation, "Unknown")
 
     @property
     def device_info(self) -> dict:
@@ -85,7 +87,9 @@ class IkeaObegransadRotationSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Rotation sensor update: %s", self.coordinator.rotation)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("Rotation sensor update: %s", self.coordinator.state.rotation)
         self.async_write_ha_state()
 
 
@@ -93,6 +97,7 @@ class IkeaObegransadBrightnessSensor(CoordinatorEntity, SensorEntity):
     """Sensor for brightness percentage."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"brightness"})
     _attr_icon = "mdi:brightness-6"
     _attr_translation_key = "brightness"
     _attr_native_unit_of_measurement = "%"
@@ -108,7 +113,7 @@ class IkeaObegransadBrightnessSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return brightness as percentage (0-100)."""
-        return round(self.coordinator.brightness * 100 / 255)
+        return round(self.coordinator.state.brightness * 100 / 255)
 
     @property
     def device_info(self) -> dict:
@@ -124,7 +129,9 @@ class IkeaObegransadBrightnessSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Brightness sensor update: %s", self.coordinator.brightness)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("Brightness sensor update: %s", self.coordinator.state.brightness)
         self.async_write_ha_state()
 
 
@@ -132,6 +139,7 @@ class IkeaObegransadActivePluginSensor(CoordinatorEntity, SensorEntity):
     """Sensor for active plugin name."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"active_effect_name"})
     _attr_icon = "mdi:puzzle"
     _attr_translation_key = "active_plugin"
 
@@ -161,6 +169,8 @@ class IkeaObegransadActivePluginSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
         _LOGGER.debug(
             "Active plugin sensor update: %s", self.coordinator.active_effect_name
         )
@@ -171,6 +181,7 @@ class IkeaObegransadStatusSensor(CoordinatorEntity, SensorEntity):
     """Sensor for device status."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"status"})
     _attr_icon = "mdi:information"
     _attr_translation_key = "status"
 
@@ -184,7 +195,7 @@ class IkeaObegransadStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return the device status."""
-        return self.coordinator.status
+        return self.coordinator.state.status
 
     @property
     def device_info(self) -> dict:
@@ -200,7 +211,9 @@ class IkeaObegransadStatusSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Status sensor update: %s", self.coordinator.status)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("Status sensor update: %s", self.coordinator.state.status)
         self.async_write_ha_state()
 
 
@@ -208,6 +221,7 @@ class IkeaObegransadScheduleCountSensor(CoordinatorEntity, SensorEntity):
     """Sensor for schedule item count."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"schedule"})
     _attr_icon = "mdi:calendar-clock"
     _attr_translation_key = "schedule_count"
     _attr_native_unit_of_measurement = "items"
@@ -223,7 +237,7 @@ class IkeaObegransadScheduleCountSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the number of scheduled items."""
-        return len(self.coordinator.schedule)
+        return len(self.coordinator.state.schedule)
 
     @property
     def device_info(self) -> dict:
@@ -239,7 +253,11 @@ class IkeaObegransadScheduleCountSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Schedule count sensor update: %s", len(self.coordinator.schedule))
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug(
+            "Schedule count sensor update: %s", len(self.coordinator.state.schedule)
+        )
         self.async_write_ha_state()
 
 
@@ -250,6 +268,7 @@ class IkeaObegransadWifiSignalSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for WiFi signal strength."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"wifi_rssi"})
     _attr_icon = "mdi:wifi"
     _attr_translation_key = "wifi_signal"
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
@@ -267,7 +286,7 @@ class IkeaObegransadWifiSignalSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return WiFi signal strength in dBm."""
-        return self.coordinator.wifi_rssi
+        return self.coordinator.state.wifi_rssi
 
     @property
     def device_info(self) -> dict:
@@ -283,7 +302,9 @@ class IkeaObegransadWifiSignalSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("WiFi signal sensor update: %s", self.coordinator.wifi_rssi)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("WiFi signal sensor update: %s", self.coordinator.state.wifi_rssi)
         self.async_write_ha_state()
 
 
@@ -291,6 +312,7 @@ class IkeaObegransadUptimeSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for device uptime."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"uptime"})
     _attr_icon = "mdi:clock-outline"
     _attr_translation_key = "uptime"
     _attr_device_class = SensorDeviceClass.DURATION
@@ -308,7 +330,7 @@ class IkeaObegransadUptimeSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return device uptime in seconds."""
-        return self.coordinator.uptime
+        return self.coordinator.state.uptime
 
     @property
     def device_info(self) -> dict:
@@ -324,7 +346,9 @@ class IkeaObegransadUptimeSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Uptime sensor update: %s", self.coordinator.uptime)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("Uptime sensor update: %s", self.coordinator.state.uptime)
         self.async_write_ha_state()
 
 
@@ -332,6 +356,7 @@ class IkeaObegransadFreeMemorySensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for free memory."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"free_memory"})
     _attr_icon = "mdi:memory"
     _attr_translation_key = "free_memory"
     _attr_native_unit_of_measurement = "B"
@@ -348,7 +373,7 @@ class IkeaObegransadFreeMemorySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return free memory in bytes."""
-        return self.coordinator.free_memory
+        return self.coordinator.state.free_memory
 
     @property
     def device_info(self) -> dict:
@@ -364,7 +389,11 @@ class IkeaObegransadFreeMemorySensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Free memory sensor update: %s", self.coordinator.free_memory)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug(
+            "Free memory sensor update: %s", self.coordinator.state.free_memory
+        )
         self.async_write_ha_state()
 
 
@@ -372,6 +401,7 @@ class IkeaObegransadIpAddressSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for device IP address."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"ip_address"})
     _attr_icon = "mdi:ip-network"
     _attr_translation_key = "ip_address"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -386,7 +416,7 @@ class IkeaObegransadIpAddressSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return device IP address."""
-        return self.coordinator.ip_address
+        return self.coordinator.state.ip_address
 
     @property
     def device_info(self) -> dict:
@@ -402,7 +432,9 @@ class IkeaObegransadIpAddressSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("IP address sensor update: %s", self.coordinator.ip_address)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug("IP address sensor update: %s", self.coordinator.state.ip_address)
         self.async_write_ha_state()
 
 
@@ -410,6 +442,7 @@ class IkeaObegransadMacAddressSensor(CoordinatorEntity, SensorEntity):
     """Diagnostic sensor for device MAC address."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"mac_address"})
     _attr_icon = "mdi:network"
     _attr_translation_key = "mac_address"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -424,7 +457,7 @@ class IkeaObegransadMacAddressSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return device MAC address."""
-        return self.coordinator.mac_address
+        return self.coordinator.state.mac_address
 
     @property
     def device_info(self) -> dict:
@@ -440,7 +473,11 @@ class IkeaObegransadMacAddressSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("MAC address sensor update: %s", self.coordinator.mac_address)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug(
+            "MAC address sensor update: %s", self.coordinator.state.mac_address
+        )
         self.async_write_ha_state()
 
 
@@ -448,6 +485,7 @@ class IkeaObegransadWeatherLocationSensor(CoordinatorEntity, SensorEntity):
     """Sensor for weather location configuration."""
 
     _attr_has_entity_name = True
+    _update_fields: ClassVar[frozenset[str]] = frozenset({"weather_location"})
     _attr_icon = "mdi:weather-cloudy"
     _attr_translation_key = "weather_location"
 
@@ -478,7 +516,11 @@ class IkeaObegransadWeatherLocationSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug("Weather location sensor update: %s", self.coordinator.weather_location)
+        if not self.coordinator.fields_changed(self._update_fields):
+            return
+        _LOGGER.debug(
+            "Weather location sensor update: %s", self.coordinator.weather_location
+        )
         self.async_write_ha_state()
 
 
@@ -0,0 +1,407 @@
+"""
+Services for the IKEA OBEGRÄNSAD LED integration.
+
+The services are registered once for the whole integration. Each call is
+routed to the lamps it targets by device, entity, area, floor or label (every
+lamp when no target is given) and runs on all of them concurrently through the fleet.
+
+Functions:
+    async_setup_services: Registers the integration's services.
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+
+from .const import (
+    ATTR_DELAY,
+    ATTR_DIRECTION,
+    ATTR_FRAME,
+    ATTR_GRAPH,
+    ATTR_MAXY,
+    ATTR_MESSAGE,
+    ATTR_MESSAGE_ID,
+    ATTR_MINY,
+    ATTR_PANELS,
+    ATTR_REPEAT,
+    ATTR_SCHEDULE,
+    ATTR_TEXT,
+    DOMAIN,
+    DOMAIN_DATA,
+    SERVICE_BROADCAST_MESSAGE,
+    SERVICE_CLEAR_SCHEDULE,
+    SERVICE_CLEAR_STORAGE,
+    SERVICE_GET_DISPLAY_DATA,
+    SERVICE_PERSIST_PLUGIN,
+    SERVICE_REMOVE_MESSAGE,
+    SERVICE_ROTATE_DISPLAY,
+    SERVICE_SEND_MESSAGE,
+    SERVICE_SET_SCHEDULE,
+    SERVICE_SET_VIDEO_WALL,
+    SERVICE_SHOW_VIDEO_WALL,
+    SERVICE_START_SCHEDULE,
+    SERVICE_STOP_SCHEDULE,
+)
+
+if TYPE_CHECKING:
+    from . import IkeaObegransadLedDataUpdateCoordinator
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+async def _async_run_on_targets(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    action: Callable[["IkeaObegransadLedDataUpdateCoordinator"], Awaitable[Any]],
+) -> dict[str, Any]:
+    """Run a service action concurrently on every lamp the call targets."""
+    fleet = hass.data[DOMAIN_DATA]
+    targets = await fleet.async_targets(call)
+    if not targets:
+        _LOGGER.warning("No IKEA OBEGRÄNSAD LED lamp targeted by %s", call.service)
+        return {}
+    return await fleet.async_run(targets, action)
+
+
+def _message_params(call: ServiceCall) -> dict[str, Any] | None:
+    """Return the send_message arguments of a call, or None if it has no content."""
+    message = call.data.get(ATTR_MESSAGE, "")
+    graph_str = call.data.get(ATTR_GRAPH)
+
+    # Parse graph string to list of integers
+    graph = None
+    if graph_str:
+        try:
+            graph = [int(x.strip()) for x in graph_str.split(",")]
+        except ValueError:
+            _LOGGER.error("Invalid graph format: %s", graph_str)
+
+    if not message and not graph:
+        _LOGGER.error("No message or graph provided")
+        return None
+
+    return {
+        "text": message,
+        "repeat": call.data.get(ATTR_REPEAT, 1),
+        "delay": call.data.get(ATTR_DELAY, 70),
+        "graph": graph,
+        "miny": call.data.get(ATTR_MINY),
+        "maxy": call.data.get(ATTR_MAXY),
+        "message_id": call.data.get(ATTR_MESSAGE_ID),
+    }
+
+
+async def _async_handle_send_message(hass: HomeAssistant, call: ServiceCall) -> None:
+    """
+    Handle sending a message to the targeted lamps.
+
+    Asynchronously sends a text message to be displayed on the lamps.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        call (ServiceCall): The service call containing message parameters.
+            Required parameters:
+                message (str): The text message to display
+            Optional parameters:
+                repeat (int, optional): Number of times to repeat the message.
+                Defaults to 1.
+                delay (int, optional): Delay between message repetitions
+                in milliseconds. Defaults to 70.
+
+    Raises:
+        aiohttp.ClientError: If there is a connection error when
+        changing the animation.
+
+    Returns:
+        None: This function doesn't return anything.
+
+    """
+    params = _message_params(call)
+    if params is None:
+        return
+
+    await _async_run_on_targets(
+        hass,
+        call,
+        lambda coordinator: coordinator.async_show_message(**params),
+    )
+
+
+async def _async_handle_broadcast_message(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """
+    Handle showing a message on the targeted lamps at the same moment.
+
+    All lamps are switched to the message background effect first; the
+    messages are then released together, each lamp's send shifted by its
+    measured round trip time so the messages start within a few
+    milliseconds of each other.
+
+    Returns:
+        ServiceResponse: Per lamp host the success flag and timings in
+        milliseconds, when a response was requested.
+
+    """
+    params = _message_params(call)
+    if params is None:
+        return {"lamps": {}} if call.return_response else None
+
+    fleet = hass.data[DOMAIN_DATA]
+    targets = await fleet.async_targets(call)
+    if not targets:
+        _LOGGER.warning("No IKEA OBEGRÄNSAD LED lamp targeted by %s", call.service)
+        return {"lamps": {}} if call.return_response else None
+    results = await fleet.async_broadcast(
+        targets,
+        lambda coordinator: coordinator.async_prepare_message(),
+        lambda coordinator: coordinator.client.send_message(**params),
+    )
+    _LOGGER.info(
+        "Message broadcast to %d of %d lamps: %s",
+        sum(1 for result in results.values() if result["success"]),
+        len(targets),
+        params["text"],
+    )
+    return {"lamps": results} if call.return_response else None
+
+
+async def _async_handle_remove_message(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle removing a message from the targeted lamps."""
+    message_id = call.data.get(ATTR_MESSAGE_ID)
+    if not message_id:
+        _LOGGER.error("No message_id provided")
+        return
+
+    async def remove(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Remove the message from one lamp."""
+        await coordinator.client.remove_message(message_id)
+        _LOGGER.info("Message removed on %s: %s", coordinator.client.host, message_id)
+
+    await _async_run_on_targets(hass, call, remove)
+
+
+async def _async_handle_set_schedule(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle setting plugin schedule."""
+    schedule = call.data.get(ATTR_SCHEDULE)
+    if not schedule:
+        _LOGGER.error("No schedule provided")
+        return
+    try:
+        parsed = json.loads(schedule)
+    except (TypeError, ValueError):
+        parsed = None
+
+    async def set_schedule(
+        coordinator: "IkeaObegransadLedDataUpdateCoordinator",
+    ) -> None:
+        """Set the schedule on one lamp."""
+        if await coordinator.client.set_schedule(schedule):
+            if parsed is not None:
+                coordinator.async_apply_optimistic({"schedule": parsed})
+            else:
+                await coordinator.async_request_refresh()
+            _LOGGER.info("Schedule set successfully on %s", coordinator.client.host)
+        else:
+            _LOGGER.error("Failed to set schedule on %s", coordinator.client.host)
+
+    await _async_run_on_targets(hass, call, set_schedule)
+
+
+async def _async_handle_schedule_action(
+    hass: HomeAssistant,
+    method: str,
+    changes: dict[str, Any],
+    done: str,
+    call: ServiceCall,
+) -> None:
+    """Handle a schedule service call by calling a client schedule method."""
+
+    async def run(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Call the schedule method on one lamp."""
+        if await getattr(coordinator.client, method)():
+            coordinator.async_apply_optimistic(changes)
+            _LOGGER.info("%s on %s", done, coordinator.client.host)
+        else:
+            _LOGGER.error(
+                "Failed to %s on %s",
+                method.replace("_", " "),
+                coordinator.client.host,
+            )
+
+    await _async_run_on_targets(hass, call, run)
+
+
+async def _async_handle_rotate_display(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle rotating the display."""
+    direction = call.data.get(ATTR_DIRECTION, "right")
+
+    async def rotate(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Rotate the display of one lamp."""
+        if coordinator.websocket:
+            # Resolves with the info event showing the new rotation, which
+            # also reaches the coordinator, so no refresh is needed
+            result = await coordinator.websocket.rotate_display(direction)
+            if result:
+                _LOGGER.info(
+                    "Display of %s rotated %s", coordinator.client.host, direction
+                )
+            else:
+                _LOGGER.error("Failed to rotate display via WebSocket")
+        else:
+            _LOGGER.warning("WebSocket not initialized for rotate_display")
+
+    await _async_run_on_targets(hass, call, rotate)
+
+
+async def _async_handle_persist_plugin(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle persisting current plugin."""
+
+    async def persist(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Persist the current plugin of one lamp."""
+        if coordinator.websocket:
+            result = await coordinator.websocket.persist_plugin()
+            if result:
+                _LOGGER.info("Plugin persisted on %s", coordinator.client.host)
+            else:
+                _LOGGER.error("Failed to persist plugin via WebSocket")
+        else:
+            _LOGGER.warning("WebSocket not initialized for persist_plugin")
+
+    await _async_run_on_targets(hass, call, persist)
+
+
+async def _async_handle_clear_storage(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle clearing device storage."""
+
+    async def clear(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Clear the storage of one lamp."""
+        if await coordinator.client.clear_storage():
+            _LOGGER.info("Storage cleared on %s", coordinator.client.host)
+        else:
+            _LOGGER.error("Failed to clear storage on %s", coordinator.client.host)
+
+    await _async_run_on_targets(hass, call, clear)
+
+
+async def _async_handle_get_display_data(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle getting display data."""
+
+    async def get(coordinator: "IkeaObegransadLedDataUpdateCoordinator") -> None:
+        """Fetch the display data of one lamp."""
+        data = await coordinator.client.get_display_data()
+        if data:
+            _LOGGER.info(
+                "Retrieved %d bytes of display data from %s",
+                len(data),
+                coordinator.client.host,
+            )
+        else:
+            _LOGGER.error("Failed to get display data from %s", coordinator.client.host)
+
+    await _async_run_on_targets(hass, call, get)
+
+
+async def _async_handle_set_video_wall(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle setting the layout of the video wall."""
+    panels = call.data.get(ATTR_PANELS)
+    if not isinstance(panels, list) or not panels:
+        _LOGGER.error("No video wall panels provided")
+        return
+    await hass.data[DOMAIN_DATA].video_wall.async_configure(panels)
+
+
+async def _async_handle_show_video_wall(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """
+    Handle showing a frame or text across the video wall.
+
+    The frame is given for the whole canvas, either as base64 or as a list
+    of brightness values in row-major order; text is rendered centered.
+
+    Returns:
+        ServiceResponse: Per panel host whether it accepted its tile, when a
+        response was requested.
+
+    """
+    video_wall = hass.data[DOMAIN_DATA].video_wall
+    if not video_wall.layout.panels:
+        _LOGGER.error("The video wall has no panels, call set_video_wall first")
+        return {"panels": {}} if call.return_response else None
+
+    if (text := call.data.get(ATTR_TEXT)) is not None:
+        canvas = await video_wall.async_render_text(text)
+    elif (frame := call.data.get(ATTR_FRAME)) is not None:
+        canvas = video_wall.decode_frame(frame)
+    else:
+        _LOGGER.error("No frame or text provided")
+        canvas = None
+    if canvas is None:
+        return {"panels": {}} if call.return_response else None
+
+    accepted = await video_wall.async_show(canvas)
+    return {"panels": accepted} if call.return_response else None
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    for service, handler in (
+        (SERVICE_SEND_MESSAGE, _async_handle_send_message),
+        (SERVICE_REMOVE_MESSAGE, _async_handle_remove_message),
+        (SERVICE_SET_SCHEDULE, _async_handle_set_schedule),
+        (SERVICE_ROTATE_DISPLAY, _async_handle_rotate_display),
+        (SERVICE_PERSIST_PLUGIN, _async_handle_persist_plugin),
+        (SERVICE_CLEAR_STORAGE, _async_handle_clear_storage),
+        (SERVICE_GET_DISPLAY_DATA, _async_handle_get_display_data),
+        (SERVICE_SET_VIDEO_WALL, _async_handle_set_video_wall),
+    ):
+        hass.services.async_register(DOMAIN, service, partial(handler, hass))
+
+    for service, handler in (
+        (SERVICE_BROADCAST_MESSAGE, _async_handle_broadcast_message),
+        (SERVICE_SHOW_VIDEO_WALL, _async_handle_show_video_wall),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(handler, hass),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    for service, method, changes, done in (
+        (
+            SERVICE_START_SCHEDULE,
+            "start_schedule",
+            {"scheduleActive": True},
+            "Schedule started",
+        ),
+        (
+            SERVICE_STOP_SCHEDULE,
+            "stop_schedule",
+            {"scheduleActive": False},
+            "Schedule stopped",
+        ),
+        (
+            SERVICE_CLEAR_SCHEDULE,
+            "clear_schedule",
+            {"scheduleActive": False, "schedule": []},
+            "Schedule cleared",
+        ),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(_async_handle_schedule_action, hass, method, changes, done),
+        )
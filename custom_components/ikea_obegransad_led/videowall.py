@@ -0,0 +1,386 @@
+"""
+Video wall mode for IKEA OBEGRÄNSAD LED.
+
+Several lamps mounted in a grid are driven as one large virtual display. A
+frame is rendered once for the whole canvas, cut into one 16x16 tile per
+panel (rotated to match how the panel is mounted) and pushed to all panels
+concurrently over their WebSockets. The writes act as a barrier: the next
+frame is only started once the write of every panel's tile has finished, so
+panels are never more than one frame apart on the sending side. The panels
+themselves are not synchronised, each shows its tile when it arrives. Frames
+produced faster than the wall can take them are collapsed to the newest one.
+
+The firmware only takes binary frames while its status is WSBINARY, which the
+Draw plugin enters. A panel in any other state is switched to Draw before its
+tile is sent, at most once per PANEL_PREPARE_INTERVAL, and reported as not
+having accepted the frame until it reports WSBINARY.
+
+Classes:
+    VideoWallPanel: Position and rotation of one lamp in the wall.
+    VideoWallLayout: Immutable layout of the wall with precomputed tile maps.
+    IkeaObegransadVideoWall: Renders and distributes frames to the panels.
+
+Constants:
+    PANEL_SIZE (int): Width and height of one panel in pixels.
+    FRAME_MIN_INTERVAL (float): Minimum delay between two frames.
+    PANEL_PREPARE_INTERVAL (float): Delay between two attempts to switch a
+        panel into binary mode.
+"""
+
+import base64
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
+
+from .coalescer import IkeaObegransadCommandCoalescer
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import IkeaObegransadLedDataUpdateCoordinator
+    from .fleet import IkeaObegransadFleet
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+PANEL_SIZE = 16
+# Upper bound of ~30 frames per second, well above what the panels show
+FRAME_MIN_INTERVAL = 1 / 30
+# A panel that did not enter binary mode is not switched again before this
+PANEL_PREPARE_INTERVAL = 10.0
+DRAW_PLUGIN = "Draw"
+STATUS_BINARY = "WSBINARY"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.video_wall"
+
+ATTR_DEVICE_ID = "device_id"
+ATTR_COLUMN = "column"
+ATTR_ROW = "row"
+ATTR_ROTATION = "rotation"
+
+PANEL_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_COLUMN): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(ATTR_ROW): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        # Quarter turns clockwise, the same steps as the display rotation
+        vol.Optional(ATTR_ROTATION, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=3)
+        ),
+    }
+)
+
+
+def _tile_map(column: int, row: int, rotation: int, width: int) -> tuple[int, ...]:
+    """
+    Return the canvas offset of every pixel of a panel's tile.
+
+    The map folds cutting and rotating into one lookup, so building a tile is
+    a single pass over 256 indices.
+    """
+    last = PANEL_SIZE - 1
+    offsets = []
+    for y in range(PANEL_SIZE):
+        for x in range(PANEL_SIZE):
+            # Source pixel within the tile for a clockwise rotated panel
+            if rotation == 1:
+                src_x, src_y = y, last - x
+            elif rotation == 2:  # noqa: PLR2004
+                src_x, src_y = last - x, last - y
+            elif rotation == 3:  # noqa: PLR2004
+                src_x, src_y = last - y, x
+            else:
+                src_x, src_y = x, y
+            offsets.append(
+                (row * PANEL_SIZE + src_y) * width + column * PANEL_SIZE + src_x
+            )
+    return tuple(offsets)
+
+
+def _render_text(text: str, width: int, height: int) -> bytes:
+    """
+    Render text centered on a canvas of the given size.
+
+    Runs in the executor; Pillow is imported on first use only.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    img = Image.new("L", (width, height))
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    draw.text(
+        ((width - (right - left)) // 2 - left, (height - (bottom - top)) // 2 - top),
+        text,
+        fill=255,
+        font=font,
+    )
+    return img.tobytes()
+
+
+@dataclass(frozen=True, slots=True)
+class VideoWallPanel:
+    """Position and rotation of one lamp in the wall."""
+
+    device_id: str
+    entry_id: str
+    column: int
+    row: int
+    rotation: int = 0
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class VideoWallLayout:
+    """Immutable wall layout with the tile map of every panel."""
+
+    panels: tuple[VideoWallPanel, ...]
+    columns: int
+    rows: int
+    tile_maps: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_panels(cls, panels: list[VideoWallPanel]) -> "VideoWallLayout":
+        """Build a layout, sizing the canvas to the panels' grid."""
+        columns = max((panel.column for panel in panels), default=-1) + 1
+        rows = max((panel.row for panel in panels), default=-1) + 1
+        width = columns * PANEL_SIZE
+        return cls(
+            panels=tuple(panels),
+            columns=columns,
+            rows=rows,
+            tile_maps=tuple(
+                _tile_map(panel.column, panel.row, panel.rotation, width)
+                for panel in panels
+            ),
+        )
+
+    @property
+    def width(self) -> int:
+        """Return the canvas width in pixels."""
+        return self.columns * PANEL_SIZE
+
+    @property
+    def height(self) -> int:
+        """Return the canvas height in pixels."""
+        return self.rows * PANEL_SIZE
+
+
+EMPTY_LAYOUT = VideoWallLayout.from_panels([])
+
+
+class IkeaObegransadVideoWall:
+    """Renders frames for the whole wall and distributes them to the panels."""
+
+    def __init__(self, hass: HomeAssistant, fleet: "IkeaObegransadFleet") -> None:
+        """
+        Initialize the video wall.
+
+        Args:
+            hass (HomeAssistant): The Home Assistant instance.
+            fleet (IkeaObegransadFleet): The fleet owning the panels' coordinators.
+
+        """
+        self.hass = hass
+        self.fleet = fleet
+        self.layout = EMPTY_LAYOUT
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._frames = IkeaObegransadCommandCoalescer(FRAME_MIN_INTERVAL)
+        # Monotonic time of the last switch to Draw, per panel host
+        self._prepared_at: dict[str, float] = {}
+        self.frames_sent = 0
+        self.frames_torn = 0
+        self.last_frame_time: float | None = None
+
+    @property
+    def frames_dropped(self) -> int:
+        """Return the number of frames superseded before they were sent."""
+        return self._frames.collapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return video wall statistics for diagnostics."""
+        return {
+            "columns": self.layout.columns,
+            "rows": self.layout.rows,
+            "panels": len(self.layout.panels),
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "frames_torn": self.frames_torn,
+            "last_frame_time": self.last_frame_time,
+        }
+
+    async def async_load(self) -> None:
+        """Load the stored layout."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        panels = [VideoWallPanel(**panel) for panel in data.get("panels", [])]
+        self.layout = VideoWallLayout.from_panels(panels)
+
+    async def async_configure(self, panels: list[dict[str, Any]]) -> bool:
+        """
+        Set and store the layout of the wall.
+
+        Args:
+            panels (list[dict]): One item per lamp with ``device_id``,
+                ``column``, ``row`` and an optional ``rotation`` in quarter
+                turns clockwise.
+
+        Returns:
+            bool: True if the layout was valid and applied.
+
+        """
+        device_registry = dr.async_get(self.hass)
+        resolved = []
+        taken = set()
+        for item in panels:
+            try:
+                panel = PANEL_SCHEMA(item)
+            except vol.Invalid:
+                _LOGGER.exception("Invalid video wall panel %s", item)
+                return False
+            device = device_registry.async_get(panel[ATTR_DEVICE_ID])
+            entry_id = next(
+                (
+                    entry_id
+                    for entry_id in (device.config_entries if device else ())
+                    if entry_id in self.fleet.coordinators
+                ),
+                None,
+            )
+            if entry_id is None:
+                _LOGGER.error("Device %s is not a loaded lamp", panel[ATTR_DEVICE_ID])
+                return False
+            position = (panel[ATTR_COLUMN], panel[ATTR_ROW])
+            if position in taken:
+                _LOGGER.error("Two panels share column/row %s", position)
+                return False
+            taken.add(position)
+            resolved.append(VideoWallPanel(entry_id=entry_id, **panel))
+
+        self.layout = VideoWallLayout.from_panels(resolved)
+        await self._store.async_save(
+            {
+                "panels": [
+                    {
+                        "device_id": panel.device_id,
+                        "entry_id": panel.entry_id,
+                        "column": panel.column,
+                        "row": panel.row,
+                        "rotation": panel.rotation,
+                    }
+                    for panel in resolved
+                ]
+            }
+        )
+        _LOGGER.info(
+            "Video wall set to %dx%d panels", self.layout.columns, self.layout.rows
+        )
+        return True
+
+    def decode_frame(self, frame: str | list[int]) -> bytes | None:
+        """
+        Turn a frame given as base64 or a list of brightness values into bytes.
+
+        Returns:
+            bytes | None: Row-major canvas pixels, or None if the frame does not
+            match the canvas size.
+
+        """
+        try:
+            if isinstance(frame, str):
+                canvas = base64.b64decode(frame, validate=True)
+            else:
+                canvas = bytes(frame)
+        except (TypeError, ValueError):
+            _LOGGER.exception("Invalid video wall frame")
+            return None
+        expected = self.layout.width * self.layout.height
+        if len(canvas) != expected:
+            _LOGGER.error(
+                "Video wall frame has %d pixels, expected %d", len(canvas), expected
+            )
+            return None
+        return canvas
+
+    async def async_render_text(self, text: str) -> bytes:
+        """Render text once for the whole canvas."""
+        return await self.hass.async_add_executor_job(
+            _render_text, text, self.layout.width, self.layout.height
+        )
+
+    async def async_show(self, canvas: bytes) -> dict[str, bool]:
+        """
+        Show a canvas frame on the wall.
+
+        Frames submitted while one is being sent replace each other; only the
+        newest is sent next, and every caller receives the result of the send
+        that carried its frame or superseded it.
+
+        Returns:
+            dict[str, bool]: Per panel host whether it accepted the frame.
+
+        """
+        return await self._frames.submit("frame", canvas, self._async_push)
+
+    async def _async_push(self, canvas: bytes) -> dict[str, bool]:
+        """Cut a canvas into tiles and send them to all panels at once."""
+        started = time.monotonic()
+        tiles = {}
+        for panel, tile_map in zip(
+            self.layout.panels, self.layout.tile_maps, strict=True
+        ):
+            coordinator = self.fleet.coordinators.get(panel.entry_id)
+            if coordinator is None or coordinator.websocket is None:
+                continue
+            tiles[coordinator] = bytes(map(canvas.__getitem__, tile_map))
+
+        unprepared = [
+            coordinator
+            for coordinator in tiles
+            if coordinator.state.status != STATUS_BINARY
+        ]
+        if unprepared:
+            await self.fleet.async_run(unprepared, self._async_prepare_panel)
+
+        # The barrier: the frame is done only when every panel took its tile
+        ready = [
+            coordinator
+            for coordinator in tiles
+            if coordinator.state.status == STATUS_BINARY
+        ]
+        results = await self.fleet.async_run(
+            ready,
+            lambda coordinator: coordinator.websocket.send_binary(tiles[coordinator]),
+        )
+        # A panel outside binary mode would drop its tile without an error
+        accepted = {coordinator.client.host: False for coordinator in tiles}
+        accepted.update((host, result is True) for host, result in results.items())
+        self.frames_sent += 1
+        if not all(accepted.values()) or len(tiles) < len(self.layout.panels):
+            self.frames_torn += 1
+        self.last_frame_time = round(time.monotonic() - started, 4)
+        return accepted
+
+    async def _async_prepare_panel(
+        self, coordinator: "IkeaObegransadLedDataUpdateCoordinator"
+    ) -> None:
+        """Switch a panel to the Draw plugin and read back its status."""
+        host = coordinator.client.host
+        now = time.monotonic()
+        last = self._prepared_at.get(host)
+        if last is not None and now - last < PANEL_PREPARE_INTERVAL:
+            return
+        self._prepared_at[host] = now
+        _LOGGER.debug("Switching %s into binary mode", host)
+        if await coordinator.async_ensure_plugin(DRAW_PLUGIN):
+            await coordinator.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Drop pending frames, e.g. when the last lamp is unloaded."""
+        await self._frames.async_shutdown()
@@ -11,23 +11,156 @@ bidirectional communication with the device, such as:
 The WebSocket connection complements the REST API by enabling instant updates
 and more efficient communication for certain operations.
 
+All writes go through one writer task per connection, fed by a bounded queue:
+consecutive state commands of the same kind (brightness, plugin) still waiting
+in the queue are merged into the newest one, binary frames that could not be
+written within FRAME_MAX_AGE are dropped, and producers are told when the queue
+is full instead of piling more writes onto the device's small receive buffer.
+
+A connection that stays silent for HEARTBEAT_INTERVAL is probed with a
+WebSocket ping, which the firmware's WebSocket server answers with a pong
+without producing an info event for the entities. A ping that cannot be written
+or is not answered within HEARTBEAT_TIMEOUT declares the connection dead, and
+it is reconnected with a jittered exponential backoff instead of waiting for
+the TCP stack to give up on a half-open socket.
+
+Incoming messages are routed by their ``event`` field to the handlers
+subscribed to it. Every handler has its own bounded queue and worker task, so
+the reader never waits for a handler and a slow handler only delays (and, when
+its queue overflows, drops the oldest of) its own events.
+
+Binary messages carry the content of the display. They are copied into the
+connection's IkeaObegransadFrameBuffer and the buffer itself is handed to the
+handlers subscribed to FRAME_EVENT, so a live preview needs no HTTP requests.
+
+Commands whose effect shows in the device info (rotation, persisted plugin) are
+sent with send_command. The firmware sends no acknowledgement of its own, so
+an info event is requested once the command is written; the device answers it
+after the command, and the first info event after the write that shows the
+change against the info known when the command was sent confirms it. Without
+one within COMMAND_CONFIRM_TIMEOUT the command counts as unconfirmed.
+
+The firmware WebSocket endpoint is at ws://{host}/ws. listen_forever keeps the
+connection open and reconnects it; the REST API remains the fallback while it
+is down.
+
 Classes:
     IkeaObegransadWebSocket: WebSocket client for the device.
-
-Note:
-    This is currently a stub implementation. Full WebSocket support requires
-    maintaining a persistent connection and handling reconnection logic.
-    The firmware websocket endpoint is at ws://{host}/ws
 """
 
 import asyncio
+import contextlib
 import logging
-from typing import Any, Callable
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
 
 import aiohttp
 
+from .framebuffer import FRAME_EVENT, FRAME_SIZE, IkeaObegransadFrameBuffer
+
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+SEND_QUEUE_SIZE = 16
+# How long a JSON command waits for room in a full queue before giving up
+SEND_QUEUE_TIMEOUT = 1.0
+# A display frame older than this is stale and not worth sending
+FRAME_MAX_AGE = 0.1
+# Commands that only set state; a queued one is replaced by a newer one
+COALESCED_EVENTS = frozenset({"brightness", "plugin"})
+
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 3.0
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_BASE_DELAY = 1.0
+
+# Events a handler may fall behind by before its oldest ones are dropped
+DISPATCH_QUEUE_SIZE = 8
+# How long a command waits for the info event confirming its effect
+COMMAND_CONFIRM_TIMEOUT = 3.0
+
+
+@dataclass(slots=True)
+class _OutgoingMessage:
+    """A queued write and the futures of every producer waiting on it."""
+
+    data: dict[str, Any] | bytes
+    event: str | None
+    deadline: float | None
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+    def resolve(self, *, sent: bool) -> None:
+        """Report the outcome of the write to every waiting producer."""
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(sent)
+
+
+class _Subscription:
+    """A message handler fed through its own bounded queue and worker task."""
+
+    def __init__(
+        self, handler: Callable[[Any], Awaitable[None]], queue_size: int
+    ) -> None:
+        """Initialize the subscription."""
+        self.handler = handler
+        self.name = getattr(handler, "__qualname__", repr(handler))
+        self._queue: deque[tuple[float, Any]] = deque(maxlen=queue_size)
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.stats: dict[str, Any] = {
+            "handled": 0,
+            "dropped": 0,
+            "errors": 0,
+            "last_latency": None,
+            "avg_latency": None,
+            "max_latency": 0.0,
+        }
+
+    def put(self, received_at: float, data: Any) -> None:
+        """Queue a message for the handler, dropping the oldest when full."""
+        if len(self._queue) == self._queue.maxlen:
+            self.stats["dropped"] += 1
+        self._queue.append((received_at, data))
+        self._ready.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        """Hand queued messages to the handler, one at a time, in order."""
+        while True:
+            if not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            received_at, data = self._queue.popleft()
+            try:
+                await self.handler(data)
+            except Exception:
+                self.stats["errors"] += 1
+                _LOGGER.exception("Error in WebSocket handler %s", self.name)
+            # Time from receiving the message to the handler being done with it
+            latency = time.monotonic() - received_at
+            stats = self.stats
+            stats["handled"] += 1
+            stats["last_latency"] = round(latency, 4)
+            avg = stats["avg_latency"]
+            stats["avg_latency"] = round(
+                latency if avg is None else avg * 0.8 + latency * 0.2, 4
+            )
+            stats["max_latency"] = round(max(stats["max_latency"], latency), 4)
+
+    def stop(self) -> None:
+        """Stop the worker task and drop queued messages."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queue.clear()
+
 
 class IkeaObegransadWebSocket:
     """WebSocket client for real-time updates and control."""
@@ -47,8 +180,44 @@ class IkeaObegransadWebSocket:
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._connected = False
         self._closing = False
-        self._callbacks: list[Callable] = []
+        # Subscriptions by event; None holds the ones receiving every event
+        self._subscriptions: dict[str | None, list[_Subscription]] = {}
+        self._connection_callbacks: list[Callable[..., None]] = []
         self._max_backoff = 300
+        self.connected_at: float | None = None
+        self.last_message_at: float | None = None
+        self._queue: deque[_OutgoingMessage] = deque()
+        self._queue_ready = asyncio.Event()
+        self._queue_space = asyncio.Event()
+        self._queue_space.set()
+        self._writer_task: asyncio.Task | None = None
+        self.send_stats = {
+            "queued": 0,
+            "sent": 0,
+            "merged": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "max_depth": 0,
+        }
+        self.frames = IkeaObegransadFrameBuffer()
+        # Latest info event, the baseline for commands awaiting a change
+        self.last_info: dict[str, Any] | None = None
+        self._confirmations: list[
+            tuple[Callable[[dict[str, Any]], bool], asyncio.Future]
+        ] = []
+        self.command_stats: dict[str, Any] = {
+            "confirmed": 0,
+            "unconfirmed": 0,
+            "last_rtt": None,
+            "avg_rtt": None,
+        }
+        self.reconnects = 0
+        self.heartbeat_stats: dict[str, Any] = {
+            "sent": 0,
+            "missed": 0,
+            "last_rtt": None,
+            "avg_rtt": None,
+        }
         _LOGGER.debug("WebSocket client initialized for host: %s", host)
 
     async def connect(self) -> bool:
@@ -68,9 +237,16 @@ class IkeaObegransadWebSocket:
 
         try:
             _LOGGER.debug("Connecting to WebSocket at %s", self.ws_url)
-            self._ws = await self.session.ws_connect(self.ws_url)
+            # Pings and pongs are handled by listen() to time the heartbeat
+            self._ws = await self.session.ws_connect(self.ws_url, autoping=False)
             self._connected = True
+            if self.connected_at is not None:
+                self.reconnects += 1
+            self.connected_at = time.monotonic()
+            self.frames.reset()
+            self._writer_task = asyncio.create_task(self._async_writer(self._ws))
             _LOGGER.info("WebSocket connected successfully")
+            self._notify_connection(connected=True)
             return True
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to connect to WebSocket: %s", err)
@@ -80,46 +256,130 @@ class IkeaObegransadWebSocket:
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket."""
         self._closing = True
+        self._stop_writer()
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.stop()
         if self._ws and not self._ws.closed:
             await self._ws.close()
             _LOGGER.debug("WebSocket disconnected")
         self._connected = False
+        self.frames.reset()
+
+    def _notify_connection(self, *, connected: bool) -> None:
+        """Call the registered connection callbacks."""
+        for callback in list(self._connection_callbacks):
+            try:
+                callback(connected=connected)
+            except Exception:
+                _LOGGER.exception("Error in WebSocket connection callback")
+
+    def add_connection_callback(self, callback: Callable[..., None]) -> None:
+        """
+        Add a callback to be called when the connection opens or drops.
+
+        Args:
+            callback (Callable): Called with ``connected=True`` on connect and
+                ``connected=False`` on drop.
+
+        """
+        self._connection_callbacks.append(callback)
+
+    def remove_connection_callback(self, callback: Callable[..., None]) -> None:
+        """
+        Remove a connection callback.
+
+        Args:
+            callback (Callable): The callback function to remove.
+
+        """
+        if callback in self._connection_callbacks:
+            self._connection_callbacks.remove(callback)
+
+    def healthy(self, window: float) -> bool:
+        """
+        Return whether the socket is connected and recently active.
+
+        Args:
+            window (float): Seconds within which the socket must have connected
+                or delivered a message.
+
+        """
+        if not self.connected:
+            return False
+        last_activity = max(self.connected_at or 0.0, self.last_message_at or 0.0)
+        return time.monotonic() - last_activity <= window
 
     @property
     def connected(self) -> bool:
         """Return whether the WebSocket is connected."""
         return self._connected and self._ws is not None and not self._ws.closed
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of writes waiting for the writer task."""
+        return len(self._queue)
+
+    @property
+    def backpressure(self) -> bool:
+        """Return True while the send queue is full and producers should back off."""
+        return len(self._queue) >= SEND_QUEUE_SIZE
+
     async def send_json(self, data: dict[str, Any]) -> bool:
         """
         Send JSON data to the device.
 
+        The message is queued for the connection's writer task. A state command
+        still waiting in the queue is replaced by a newer one of the same kind;
+        both callers get the result of the single write.
+
         Args:
             data (dict): The data to send.
 
         Returns:
-            bool: True if sent successfully, False otherwise.
+            bool: True if sent successfully, False if the socket is down, the
+            queue stayed full for SEND_QUEUE_TIMEOUT or the write failed.
 
         """
         if not self.connected:
-            _LOGGER.warning("WebSocket not connected, attempting to reconnect")
-            if not await self.connect():
+            _LOGGER.debug("WebSocket not connected, not sending %s", data)
+            return False
+
+        event = data.get("event")
+        future = asyncio.get_running_loop().create_future()
+        if event in COALESCED_EVENTS:
+            for queued in self._queue:
+                if queued.event == event:
+                    _LOGGER.debug("Merging queued %s into %s", queued.data, data)
+                    queued.data = data
+                    queued.waiters.append(future)
+                    self.send_stats["merged"] += 1
+                    return await future
+
+        if self.backpressure:
+            try:
+                async with asyncio.timeout(SEND_QUEUE_TIMEOUT):
+                    while self.backpressure:
+                        self._queue_space.clear()
+                        await self._queue_space.wait()
+            except TimeoutError:
+                self.send_stats["rejected"] += 1
+                _LOGGER.warning("WebSocket send queue full, rejecting %s", data)
+                return False
+            if not self.connected:
                 return False
 
-        try:
-            await self._ws.send_json(data)
-            _LOGGER.debug("Sent WebSocket message: %s", data)
-            return True
-        except (aiohttp.ClientError, RuntimeError) as err:
-            _LOGGER.error("Failed to send WebSocket message: %s", err)
-            self._connected = False
-            return False
+        self._enqueue(_OutgoingMessage(data, event, None, [future]))
+        return await future
 
     async def send_binary(self, data: bytes) -> bool:
         """
         Send binary data to the device.
 
-        Used for sending raw display data when currentStatus is WSBINARY.
+        Used for sending raw display data when currentStatus is WSBINARY. A
+        frame replaces any older frame still queued, is never waited on when
+        the queue is full and is dropped if it cannot be written within
+        FRAME_MAX_AGE, since a newer frame will follow.
 
         Args:
             data (bytes): The binary data to send (should be 256 bytes for 16x16).
@@ -129,49 +389,234 @@ class IkeaObegransadWebSocket:
 
         """
         if not self.connected:
-            _LOGGER.warning("WebSocket not connected, attempting to reconnect")
-            if not await self.connect():
-                return False
+            _LOGGER.debug("WebSocket not connected, not sending frame")
+            return False
 
-        if len(data) != 256:
+        if len(data) != FRAME_SIZE:
             _LOGGER.error(
-                "Invalid binary data size: %d bytes (expected 256)", len(data)
+                "Invalid binary data size: %d bytes (expected %d)",
+                len(data),
+                FRAME_SIZE,
             )
             return False
 
-        try:
-            await self._ws.send_bytes(data)
-            _LOGGER.debug("Sent %d bytes of binary data", len(data))
-            return True
-        except (aiohttp.ClientError, RuntimeError) as err:
-            _LOGGER.error("Failed to send binary data: %s", err)
-            self._connected = False
+        for queued in self._queue:
+            if queued.event is None:
+                # The older frame is superseded before it was written
+                queued.resolve(sent=False)
+                self.send_stats["dropped"] += 1
+                future = asyncio.get_running_loop().create_future()
+                queued.data = data
+                queued.waiters = [future]
+                queued.deadline = time.monotonic() + FRAME_MAX_AGE
+                return await future
+
+        if self.backpressure:
+            self.send_stats["rejected"] += 1
             return False
 
-    async def rotate_display(self, direction: str = "right") -> bool:
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(
+            _OutgoingMessage(data, None, time.monotonic() + FRAME_MAX_AGE, [future])
+        )
+        return await future
+
+    def _enqueue(self, message: _OutgoingMessage) -> None:
+        """Append a message to the send queue and wake the writer."""
+        self._queue.append(message)
+        self.send_stats["queued"] += 1
+        self.send_stats["max_depth"] = max(
+            self.send_stats["max_depth"], len(self._queue)
+        )
+        self._queue_ready.set()
+
+    async def _async_writer(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Write queued messages to the socket, one at a time, in order."""
+        try:
+            while True:
+                if not self._queue:
+                    self._queue_ready.clear()
+                    await self._queue_ready.wait()
+                    continue
+                message = self._queue.popleft()
+                self._queue_space.set()
+
+                if message.deadline is not None and time.monotonic() > message.deadline:
+                    self.send_stats["dropped"] += 1
+                    _LOGGER.debug("Dropping late display frame")
+                    message.resolve(sent=False)
+                    continue
+
+                try:
+                    if isinstance(message.data, bytes):
+                        await ws.send_bytes(message.data)
+                        _LOGGER.debug("Sent %d bytes of binary data", len(message.data))
+                    else:
+                        await ws.send_json(message.data)
+                        _LOGGER.debug("Sent WebSocket message: %s", message.data)
+                except (aiohttp.ClientError, RuntimeError) as err:
+                    # Expected when the socket dies; a traceback adds nothing
+                    _LOGGER.error(  # noqa: TRY400
+                        "Failed to send WebSocket message: %s", err
+                    )
+                    self._connected = False
+                    message.resolve(sent=False)
+                    break
+                self.send_stats["sent"] += 1
+                message.resolve(sent=True)
+        finally:
+            self._fail_queued()
+
+    def _stop_writer(self) -> None:
+        """Stop the writer task of the current connection."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._fail_queued()
+
+    def _fail_queued(self) -> None:
+        """Fail every queued write; the connection they were meant for is gone."""
+        while self._queue:
+            self._queue.popleft().resolve(sent=False)
+        self._queue_space.set()
+
+    async def send_command(
+        self,
+        data: dict[str, Any],
+        confirm: Callable[[dict[str, Any], dict[str, Any]], bool],
+        confirm_timeout: float = COMMAND_CONFIRM_TIMEOUT,
+    ) -> dict[str, Any] | None:
+        """
+        Send a command and wait until the device reports its effect.
+
+        Only info events received after the command was written are checked,
+        and the device is asked for one, so the confirmation does not depend
+        on the firmware pushing its state by itself.
+
+        Args:
+            data (dict): The command to send.
+            confirm (Callable): Called with the info known when the command was
+                sent and a later info payload; returns True if the later one
+                shows the command took effect.
+            confirm_timeout (float): Seconds to wait for the confirming info
+                event.
+
+        Returns:
+            dict | None: The confirming info payload, or None if the command
+            could not be sent or was not confirmed in time.
+
+        """
+        before = self.last_info
+        if before is None:
+            # Without a snapshot a change cannot be told from the old state
+            before = await self._async_await_info(lambda _info: True, confirm_timeout)
+        started = time.monotonic()
+        info = None
+        # A command that was never written is a lost command all the same
+        if before is not None and await self.send_json(data):
+            info = await self._async_await_info(
+                partial(confirm, before), confirm_timeout
+            )
+
+        stats = self.command_stats
+        if info is None:
+            stats["unconfirmed"] += 1
+            _LOGGER.warning("%s was not confirmed by %s", data, self.host)
+            return None
+        rtt = time.monotonic() - started
+        stats["confirmed"] += 1
+        stats["last_rtt"] = round(rtt, 4)
+        avg = stats["avg_rtt"]
+        stats["avg_rtt"] = round(rtt if avg is None else avg * 0.8 + rtt * 0.2, 4)
+        _LOGGER.debug("%s confirmed in %.3fs", data, rtt)
+        return info
+
+    async def _async_await_info(
+        self, accept: Callable[[dict[str, Any]], bool], info_timeout: float
+    ) -> dict[str, Any] | None:
+        """
+        Request an info event and wait for the first one accepted.
+
+        The waiter is registered after everything written so far, so an
+        accepted event always describes the device after those writes.
+
+        Args:
+            accept (Callable): Returns True for the info payload waited for.
+            info_timeout (float): Seconds to wait for it.
+
+        Returns:
+            dict | None: The accepted info payload, or None if none arrived.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiter = (accept, future)
+        self._confirmations.append(waiter)
+        try:
+            if not await self.request_info():
+                return None
+            async with asyncio.timeout(info_timeout):
+                return await future
+        except TimeoutError:
+            return None
+        finally:
+            if waiter in self._confirmations:
+                self._confirmations.remove(waiter)
+
+    def _confirm(self, info: dict[str, Any]) -> None:
+        """Resolve the commands an info payload confirms."""
+        self.last_info = info
+        for confirm, future in list(self._confirmations):
+            if future.done():
+                continue
+            try:
+                confirmed = confirm(info)
+            except Exception:
+                _LOGGER.exception("Error checking command confirmation")
+                confirmed = False
+            if confirmed:
+                future.set_result(info)
+
+    def _fail_confirmations(self) -> None:
+        """Fail the commands awaiting confirmation; the connection is gone."""
+        for _confirm, future in self._confirmations:
+            if not future.done():
+                future.set_result(None)
+
+    async def rotate_display(self, direction: str = "right") -> dict[str, Any] | None:
         """
-        Send rotation command to the device.
+        Rotate the display and wait until the device reports the new rotation.
 
         Args:
             direction (str): Rotation direction ('right' or 'left').
 
         Returns:
-            bool: True if command sent successfully, False otherwise.
+            dict | None: The info payload with the new rotation, or None if the
+            command failed or was not confirmed.
 
         """
         data = {"event": "rotate", "direction": direction}
-        return await self.send_json(data)
+        return await self.send_command(
+            data,
+            lambda before, info: "rotation" in info
+            and info["rotation"] != before.get("rotation"),
+        )
 
-    async def persist_plugin(self) -> bool:
+    async def persist_plugin(self) -> dict[str, Any] | None:
         """
-        Send command to persist the current plugin.
+        Persist the current plugin and wait until the device reports it.
 
         Returns:
-            bool: True if command sent successfully, False otherwise.
+            dict | None: The info payload with the persisted plugin, or None if
+            the command failed or was not confirmed.
 
         """
         data = {"event": "persist-plugin"}
-        return await self.send_json(data)
+        # The command persists the plugin that was active when it was sent
+        return await self.send_command(
+            data,
+            lambda before, info: before.get("plugin") is not None
+            and info.get("persist-plugin") == before["plugin"],
+        )
 
     async def set_plugin(self, plugin_id: int) -> bool:
         """
@@ -212,6 +657,46 @@ class IkeaObegransadWebSocket:
         data = {"event": "info"}
         return await self.send_json(data)
 
+    def subscribe(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        *events: str,
+        queue_size: int = DISPATCH_QUEUE_SIZE,
+    ) -> Callable[[], None]:
+        """
+        Subscribe a handler to incoming messages.
+
+        The handler runs in its own task, fed through a queue of at most
+        ``queue_size`` messages; when it falls further behind, its oldest
+        queued messages are dropped.
+
+        Args:
+            handler (Callable): Coroutine function called with each message.
+            *events (str): The ``event`` values to receive; every JSON message
+                if none are given. Handlers of FRAME_EVENT receive the shared
+                IkeaObegransadFrameBuffer and are best given a ``queue_size``
+                of 1, as every queued item refers to the same, latest frame.
+            queue_size (int): How many messages may wait for the handler.
+
+        Returns:
+            Callable: Function removing the subscription again.
+
+        """
+        subscription = _Subscription(handler, queue_size)
+        keys = events or (None,)
+        for key in keys:
+            self._subscriptions.setdefault(key, []).append(subscription)
+
+        def unsubscribe() -> None:
+            """Remove the subscription and stop its worker."""
+            subscription.stop()
+            for key in keys:
+                subscriptions = self._subscriptions.get(key, [])
+                if subscription in subscriptions:
+                    subscriptions.remove(subscription)
+
+        return unsubscribe
+
     def add_callback(self, callback: Callable) -> None:
         """
         Add a callback to be called when WebSocket messages are received.
@@ -220,7 +705,7 @@ class IkeaObegransadWebSocket:
             callback (Callable): The callback function.
 
         """
-        self._callbacks.append(callback)
+        self.subscribe(callback)
 
     def remove_callback(self, callback: Callable) -> None:
         """
@@ -230,69 +715,203 @@ class IkeaObegransadWebSocket:
             callback (Callable): The callback function to remove.
 
         """
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        subscriptions = self._subscriptions.get(None, [])
+        for subscription in list(subscriptions):
+            if subscription.handler == callback:
+                subscription.stop()
+                subscriptions.remove(subscription)
+
+    @property
+    def dispatch_stats(self) -> dict[str, dict[str, Any]]:
+        """Return queue and latency statistics per subscribed handler."""
+        return {
+            subscription.name: subscription.stats
+            for subscriptions in self._subscriptions.values()
+            for subscription in subscriptions
+        }
+
+    def _dispatch(self, event: str | None, data: Any, received_at: float) -> None:
+        """Queue a message for the handlers subscribed to its event."""
+        for subscription in self._subscriptions.get(event, ()):
+            subscription.put(received_at, data)
+        for subscription in self._subscriptions.get(None, ()):
+            subscription.put(received_at, data)
 
     async def listen(self) -> None:
         """
         Listen for incoming WebSocket messages.
 
         This is a long-running coroutine that should be run as a task.
-        It will continuously listen for messages and call registered callbacks.
+        It will continuously read messages and hand them to the subscribed
+        handlers' queues without waiting for the handlers.
         """
         if not self.connected:
             _LOGGER.debug("WebSocket listen called while disconnected")
             return
 
+        ws = self._ws
+        probe_sent_at: float | None = None
         try:
-            async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    try:
-                        data = msg.json()
-                        _LOGGER.debug("Received WebSocket message: %s", data)
-                        for callback in self._callbacks:
-                            try:
-                                await callback(data)
-                            except Exception as err:
-                                _LOGGER.exception(
-                                    "Error in WebSocket callback: %s", err
-                                )
-                    except ValueError:
-                        _LOGGER.error("Failed to parse WebSocket message as JSON")
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error("WebSocket error: %s", self._ws.exception())
-                    break
-                elif msg.type in (
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.CLOSING,
-                ):
-                    _LOGGER.info("WebSocket connection closing")
+            while True:
+                try:
+                    msg = await ws.receive(
+                        timeout=HEARTBEAT_TIMEOUT
+                        if probe_sent_at is not None
+                        else HEARTBEAT_INTERVAL
+                    )
+                except TimeoutError:
+                    if probe_sent_at is not None:
+                        self._heartbeat_missed()
+                        break
+                    # Quiet socket: ping it to prove it is alive
+                    probe_sent_at = time.monotonic()
+                    if not await self._async_ping(ws):
+                        break
+                    continue
+
+                # Any message proves the connection is alive
+                self.last_message_at = time.monotonic()
+                if msg.type == aiohttp.WSMsgType.PONG and probe_sent_at is not None:
+                    self._record_heartbeat(self.last_message_at - probe_sent_at)
+                probe_sent_at = None
+                if not await self._async_handle_message(ws, msg):
                     break
         except Exception as err:
             _LOGGER.exception("Error in WebSocket listener: %s", err)
         finally:
             self._connected = False
+            self._stop_writer()
+            self._fail_confirmations()
+            self.frames.reset()
+            if not ws.closed:
+                # A dead peer never answers the close handshake
+                with contextlib.suppress(TimeoutError, aiohttp.ClientError):
+                    async with asyncio.timeout(HEARTBEAT_TIMEOUT):
+                        await ws.close()
             _LOGGER.debug("WebSocket listener stopped")
+            self._notify_connection(connected=False)
+
+    async def _async_handle_message(
+        self, ws: aiohttp.ClientWebSocketResponse, msg: aiohttp.WSMessage
+    ) -> bool:
+        """
+        Handle one message read from the connection.
+
+        Args:
+            ws (aiohttp.ClientWebSocketResponse): The connection it was read from.
+            msg (aiohttp.WSMessage): The message.
+
+        Returns:
+            bool: False if the connection is closing or failed.
+
+        """
+        if msg.type == aiohttp.WSMsgType.PING:
+            # autoping is off, so pings from the device are answered here
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(HEARTBEAT_TIMEOUT):
+                    await ws.pong(msg.data)
+        elif msg.type == aiohttp.WSMsgType.TEXT:
+            self._handle_text(msg, self.last_message_at)
+        elif msg.type == aiohttp.WSMsgType.BINARY:
+            self._handle_binary(msg.data, self.last_message_at)
+        elif msg.type == aiohttp.WSMsgType.ERROR:
+            _LOGGER.error("WebSocket error: %s", ws.exception())
+            return False
+        elif msg.type in (
+            aiohttp.WSMsgType.CLOSE,
+            aiohttp.WSMsgType.CLOSED,
+            aiohttp.WSMsgType.CLOSING,
+        ):
+            _LOGGER.info("WebSocket connection closing")
+            return False
+        return True
+
+    def _handle_text(self, msg: aiohttp.WSMessage, received_at: float) -> None:
+        """Resolve confirmations with and dispatch a JSON message."""
+        try:
+            data = msg.json()
+        except ValueError:
+            _LOGGER.exception("Failed to parse WebSocket message as JSON")
+            return
+        _LOGGER.debug("Received WebSocket message: %s", data)
+        event = data.get("event") if isinstance(data, dict) else None
+        if event == "info":
+            self._confirm(data)
+        self._dispatch(event, data, received_at)
+
+    def _handle_binary(self, data: bytes, received_at: float) -> None:
+        """Store a display frame and hand the buffer to its subscribers."""
+        if self.frames.update(data, received_at):
+            for subscription in self._subscriptions.get(FRAME_EVENT, ()):
+                subscription.put(received_at, self.frames)
+
+    async def _async_ping(self, ws: aiohttp.ClientWebSocketResponse) -> bool:
+        """
+        Send a heartbeat ping.
+
+        The ping skips the writer queue, but its write still waits while the
+        socket buffer is full, which a half-open socket never drains; the write
+        is therefore bounded by HEARTBEAT_TIMEOUT like the answer.
+
+        Args:
+            ws (aiohttp.ClientWebSocketResponse): The connection to probe.
+
+        Returns:
+            bool: True if the ping was written in time.
+
+        """
+        self.heartbeat_stats["sent"] += 1
+        try:
+            async with asyncio.timeout(HEARTBEAT_TIMEOUT):
+                await ws.ping()
+        except TimeoutError:
+            self._heartbeat_missed()
+            return False
+        return True
+
+    def _heartbeat_missed(self) -> None:
+        """Record a heartbeat that was not answered in time."""
+        self.heartbeat_stats["missed"] += 1
+        _LOGGER.warning(
+            "No heartbeat answer from %s within %.0fs, reconnecting",
+            self.host,
+            HEARTBEAT_TIMEOUT,
+        )
+
+    def _record_heartbeat(self, rtt: float) -> None:
+        """Record the round trip time of an answered heartbeat."""
+        stats = self.heartbeat_stats
+        stats["last_rtt"] = round(rtt, 4)
+        avg = stats["avg_rtt"]
+        stats["avg_rtt"] = round(rtt if avg is None else avg * 0.8 + rtt * 0.2, 4)
+
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Return a jittered exponential backoff delay for a reconnect attempt."""
+        ceiling = min(self._max_backoff, RECONNECT_BASE_DELAY * 2**attempt)
+        return random.uniform(  # noqa: S311
+            RECONNECT_MIN_DELAY, max(RECONNECT_MIN_DELAY, ceiling)
+        )
 
     async def listen_forever(self) -> None:
         """
         Listen for incoming WebSocket messages with automatic reconnection.
 
-        Uses exponential backoff with a max delay of 5 minutes.
+        Uses exponential backoff with full jitter and a max delay of 5 minutes,
+        so several lamps (or integrations) do not reconnect in lockstep.
         """
         self._closing = False
-        backoff = 1
+        attempt = 0
 
         while not self._closing:
             connected = await self.connect()
             if not connected:
-                await asyncio.sleep(backoff)
-                backoff = min(self._max_backoff, backoff * 2)
+                await asyncio.sleep(self._reconnect_delay(attempt))
+                attempt += 1
                 continue
 
-            backoff = 1
+            attempt = 0
             await self.listen()
 
             if not self._closing:
-                await asyncio.sleep(backoff)
-                backoff = min(self._max_backoff, backoff * 2)
+                await asyncio.sleep(self._reconnect_delay(attempt))
+                attempt += 1